@@ -38,6 +38,10 @@ def parse_input(input_path, output_path):
             # 272 bits = 68 hex chars
             f.write(f"{val:068X}\n")
 
+    # The last vector's unused items are zero, like an L0 command; readers
+    # need the command count to tell them apart (see sw/solve.py read_packed)
+    return len(lines)
+
 if __name__ == "__main__":
     # Determine base directory (../ relative to script)
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -47,4 +51,5 @@ if __name__ == "__main__":
     output_path = os.path.join(base_dir, "data", "input.hex")
     
     print(f"Generating Vectorized ROM hex (W={VECTOR_WIDTH}) from {input_path} to {output_path}")
-    parse_input(input_path, output_path)
+    count = parse_input(input_path, output_path)
+    print(f"Packed {count} commands")
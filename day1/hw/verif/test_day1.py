@@ -26,15 +26,15 @@ async def test_day1_solution(dut):
     sys.path.append(sw_dir)
 
     try:
-        from solve import solve as solve_ref
+        from solve import solve as solve_ref, FAST_MODE
     except ImportError:
         dut._log.error(f"Could not import solve.py from {sw_dir}")
         raise
     
-    dut._log.info(f"Running Python Reference on {input_path}...")
+    dut._log.info(f"Running Python Reference ({FAST_MODE}) on {input_path}...")
     
     # solve.py returns (part1, part2)
-    exp_p1, exp_p2 = solve_ref(input_path)
+    exp_p1, exp_p2 = solve_ref(input_path, mode=FAST_MODE)
     dut._log.info(f"Python Reference: Part1={exp_p1}, Part2={exp_p2}")
 
     # 2. Setup FPGA Simulation
@@ -1,51 +1,376 @@
-def solve(filename):
-    try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        print("Error: 'input' file not found.")
-        return
+import os
+import sys
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:  # only needed for mode="numpy"
+    np = None
+
+DIAL_SIZE = 100
+START_POS = 50
+
+# Packed vector layout shared with hw/scripts/gen_hex.py
+VECTOR_WIDTH = 16
+ITEM_BITS = 17
+ITEM_MASK = (1 << ITEM_BITS) - 1
+
+# Read size for mode="stream"
+CHUNK_SIZE = 1 << 20
+
+
+def parse_command(line):
+    """Split an 'L42' / 'R7' line into (direction, distance)."""
+    return line[0], int(line[1:])
+
 
-    current_pos = 50
+def zero_hits(pos, direction, distance):
+    """Count clicks that land on 0 while turning `distance` clicks from `pos`.
+
+    Right turns hit 0 once per multiple of 100 in [pos+1, pos+distance].
+    Left turns are mirrored onto the same count: (DIAL_SIZE - pos) is how far
+    the dial is from 0 going left, so the floor division is identical.
+    """
+    if direction == 'R':
+        return (pos + distance) // DIAL_SIZE
+    return ((DIAL_SIZE - pos) % DIAL_SIZE + distance) // DIAL_SIZE
+
+
+def zero_hits_stepped(pos, direction, distance):
+    """Reference version of zero_hits() that walks the remainder one click at a time."""
+    # Count full rotations
+    count = distance // DIAL_SIZE
+
+    # Simulate remaining steps
+    temp_pos = pos
+    for _ in range(distance % DIAL_SIZE):
+        if direction == 'L':
+            temp_pos = (temp_pos - 1) % DIAL_SIZE
+        elif direction == 'R':
+            temp_pos = (temp_pos + 1) % DIAL_SIZE
+
+        if temp_pos == 0:
+            count += 1
+    return count
+
+
+def run_commands(commands, pos=START_POS, hits=zero_hits):
+    """Apply (direction, distance) commands starting at `pos`.
+
+    Returns (end_pos, part1_count, part2_count).
+    """
     part1_count = 0
     part2_count = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        direction = line[0]
-        distance = int(line[1:])
-
-        # Part 2: Count full rotations
-        part2_count += distance // 100
-        
-        # Simulate remaining steps for Part 2
-        remainder = distance % 100
-        temp_pos = current_pos
-        for _ in range(remainder):
-            if direction == 'L':
-                temp_pos = (temp_pos - 1) % 100
-            elif direction == 'R':
-                temp_pos = (temp_pos + 1) % 100
-            
-            if temp_pos == 0:
-                part2_count += 1
+    for direction, distance in commands:
+        # Part 2: Every click that lands on 0
+        part2_count += hits(pos, direction, distance)
 
         # Part 1: Update final position for this command
         if direction == 'L':
-            current_pos = (current_pos - distance) % 100
+            pos = (pos - distance) % DIAL_SIZE
         else:
-            current_pos = (current_pos + distance) % 100
-            
-        if current_pos == 0:
-             part1_count += 1
+            pos = (pos + distance) % DIAL_SIZE
+
+        if pos == 0:
+            part1_count += 1
+
+    return pos, part1_count, part2_count
+
+
+def read_blocks(f, chunk_size=CHUNK_SIZE):
+    """Yield blocks of whole lines from a binary file object.
+
+    Reads `chunk_size` bytes at a time and carries a line split across a
+    chunk boundary into the next block, so memory stays at one chunk
+    regardless of the input size.
+    """
+    partial = b''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        block = partial + chunk
+        cut = block.rfind(b'\n') + 1
+        partial = block[cut:]
+        if cut:
+            yield block[:cut]
+    if partial.strip():
+        yield partial
+
+
+def read_chunked(f, chunk_size=CHUNK_SIZE):
+    """Yield commands from a binary file object with constant memory."""
+    for block in read_blocks(f, chunk_size):
+        for line in block.split():
+            yield chr(line[0]), int(line[1:])
+
+
+def solve_stream(f, chunk_size=CHUNK_SIZE):
+    """Solve from an open binary stream with constant memory.
+
+    Each block is evaluated with the NumPy engine when it is available,
+    carrying the dial position from one block to the next.
+    """
+    if np is None:
+        _, part1_count, part2_count = run_commands(read_chunked(f, chunk_size))
+        return part1_count, part2_count
+
+    pos = START_POS
+    part1_count = 0
+    part2_count = 0
+    for block in read_blocks(f, chunk_size):
+        pos, p1, p2 = run_displacements_np(parse_commands_np(block), pos)
+        part1_count += p1
+        part2_count += p2
+    return part1_count, part2_count
+
+
+def transfer_table(commands):
+    """Summarise a segment of commands for every possible start position.
+
+    Returns a 100-entry list where entry s is (end_pos, part1, part2) for a
+    segment entered at position s. Tables compose associatively (see
+    compose_tables), the same monoid the hardware prefix scan reduces over.
+
+    Built in one pass: positions are tracked unwrapped relative to s = 0,
+    and for start s a value x gains an extra wrap exactly when
+    x % 100 >= 100 - s, so per-residue histograms cover all 100 starts.
+    """
+    offset = 0
+    base_wraps = 0
+    wrap_delta = [0] * DIAL_SIZE   # +/-1 per residue, summed over r >= 100 - s
+    end_hist = [0] * DIAL_SIZE     # residues of every end position
+
+    for direction, distance in commands:
+        start = offset
+        if direction == 'L':
+            offset -= distance
+            # Hits in [end, start - 1] == floor((start-1)/100) - floor((end-1)/100)
+            hi, lo = start - 1, offset - 1
+        else:
+            offset += distance
+            # Hits in [start + 1, end] == floor(end/100) - floor(start/100)
+            hi, lo = offset, start
+        base_wraps += hi // DIAL_SIZE - lo // DIAL_SIZE
+        wrap_delta[hi % DIAL_SIZE] += 1
+        wrap_delta[lo % DIAL_SIZE] -= 1
+        end_hist[offset % DIAL_SIZE] += 1
+
+    table = []
+    extra = 0
+    for s in range(DIAL_SIZE):
+        if s:
+            extra += wrap_delta[DIAL_SIZE - s]
+        table.append(((s + offset) % DIAL_SIZE,
+                      end_hist[-s % DIAL_SIZE],
+                      base_wraps + extra))
+    return table
+
+
+def compose_tables(first, second):
+    """Transfer table for running `first` and then `second`."""
+    composed = []
+    for mid, p1, p2 in first:
+        end, q1, q2 = second[mid]
+        composed.append((end, p1 + q1, p2 + q2))
+    return composed
+
+
+def read_segment(filename, start, end):
+    """Yield the commands of lines that begin in byte range [start, end)."""
+    with open(filename, 'rb') as f:
+        if start:
+            # A line straddling `start` belongs to the previous segment
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            line = line.strip()
+            if line:
+                yield chr(line[0]), int(line[1:])
+
 
+def segment_table(args):
+    """Pool worker: transfer table for one byte range of the input."""
+    return transfer_table(read_segment(*args))
+
+
+def solve_parallel(filename, processes=None, segments_per_process=4):
+    """Map-reduce solver: per-segment transfer tables composed in order."""
+    processes = processes or os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    num_segments = max(1, processes * segments_per_process)
+    bounds = [size * i // num_segments for i in range(num_segments + 1)]
+    tasks = [(filename, lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+
+    with Pool(processes) as pool:
+        total = None
+        for table in pool.imap(segment_table, tasks):
+            total = table if total is None else compose_tables(total, table)
+
+    _, part1_count, part2_count = total[START_POS]
     return part1_count, part2_count
-    # print(f"Password: {zero_count}")
+
+
+def unpack_vector(word, items=VECTOR_WIDTH):
+    """Yield the first `items` (direction, distance) items of one packed 272-bit vector.
+
+    Item 0 sits at the LSB; bit 16 of each item is the direction (1 = R).
+    An all-zero item is a real L0 command unless it is padding past `items`.
+    """
+    for i in range(items):
+        item = (word >> (i * ITEM_BITS)) & ITEM_MASK
+        yield ('R' if item >> 16 else 'L'), item & 0xFFFF
+
+
+def read_packed(hex_path, count=None):
+    """Yield commands from a hex file written by hw/scripts/gen_hex.py.
+
+    Only the last vector can be partial, with its unused items zero.
+    With `count` (the number of commands packed) the padding is cut exactly.
+    Without it, trailing all-zero items of the last vector are taken as
+    padding, so trailing L0 commands cannot be told apart and are dropped.
+    """
+    with open(hex_path, 'r') as f:
+        words = [int(line, 16) for line in f if line.strip()]
+
+    for word in words[:-1]:
+        yield from unpack_vector(word)
+    if not words:
+        return
+
+    last = words[-1]
+    if count is not None:
+        items = count - VECTOR_WIDTH * (len(words) - 1)
+    else:
+        items = VECTOR_WIDTH
+        while items and not (last >> ((items - 1) * ITEM_BITS)) & ITEM_MASK:
+            items -= 1
+    yield from unpack_vector(last, items)
+
+
+def solve_packed(hex_path, count=None):
+    """Solve directly from the 16-wide packed ROM image (see read_packed for `count`)."""
+    _, part1_count, part2_count = run_commands(read_packed(hex_path, count))
+    return part1_count, part2_count
+
+
+def parse_commands_np(data):
+    """Parse a whole rotation log (bytes) into a signed int64 displacement array.
+
+    Commands are located by byte class and their digits are accumulated one
+    place value at a time, so there is no Python loop over lines.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (buf >= ord('0')) & (buf <= ord('9'))
+    dir_idx = np.flatnonzero((buf == ord('L')) | (buf == ord('R')))
+    sign = np.where(buf[dir_idx] == ord('R'), 1, -1)
+
+    # One digit run per command; its end is where a digit meets a non-digit
+    run_end = is_digit & ~np.append(is_digit[1:], False)
+    ends = np.flatnonzero(run_end) + 1
+    num_digits = ends - dir_idx - 1
+
+    # Fold digits in from the units column outward, one place value per pass
+    distance = np.zeros(len(dir_idx), dtype=np.int64)
+    width = int(num_digits.max()) if len(dir_idx) else 0
+    for place in range(width):
+        digit = buf.take(ends - 1 - place, mode='clip').astype(np.int64) - ord('0')
+        distance += np.where(place < num_digits, digit, 0) * 10 ** place
+
+    return sign * distance
+
+
+def run_displacements_np(disp, pos=START_POS):
+    """Vectorized run_commands() over signed displacements.
+
+    Works on the unwrapped position (start + prefix sum) so that crossings are
+    a difference of floor divisions, like the hardware prefix scan.
+    Returns (end_pos, part1_count, part2_count).
+    """
+    ends = pos + np.cumsum(disp, dtype=np.int64)
+    starts = np.concatenate(([pos], ends[:-1]))
+
+    part1_count = np.count_nonzero(ends % DIAL_SIZE == 0)
+
+    right = disp > 0
+    wraps = np.where(
+        right,
+        ends // DIAL_SIZE - starts // DIAL_SIZE,
+        (starts - 1) // DIAL_SIZE - (ends - 1) // DIAL_SIZE,
+    )
+    part2_count = wraps.sum()
+
+    end_pos = int(ends[-1] % DIAL_SIZE) if len(ends) else pos
+    return end_pos, int(part1_count), int(part2_count)
+
+
+def solve_np(filename):
+    """NumPy batch solver: parse and evaluate the whole log as arrays."""
+    with open(filename, 'rb') as f:
+        disp = parse_commands_np(f.read())
+    _, part1_count, part2_count = run_displacements_np(disp)
+    return part1_count, part2_count
+
+
+# Fastest mode available in this environment
+FAST_MODE = "numpy" if np is not None else "closed"
+
+
+def solve(filename, mode="closed"):
+    """Solve both parts.
+
+    mode="closed" uses the O(1) floor-division crossing count per command;
+    mode="step" walks every remainder click and is kept as the reference;
+    mode="numpy" evaluates the whole file with array arithmetic;
+    mode="stream" reads fixed-size chunks with constant memory ("-" is stdin);
+    mode="parallel" reduces per-segment transfer tables across a process pool.
+    """
+    if mode == "parallel":
+        try:
+            return solve_parallel(filename)
+        except FileNotFoundError:
+            print("Error: 'input' file not found.")
+            return
+
+    if mode == "stream":
+        if filename == "-":
+            return solve_stream(sys.stdin.buffer)
+        try:
+            with open(filename, 'rb') as f:
+                return solve_stream(f)
+        except FileNotFoundError:
+            print("Error: 'input' file not found.")
+            return
+
+    if mode == "numpy":
+        try:
+            return solve_np(filename)
+        except FileNotFoundError:
+            print("Error: 'input' file not found.")
+            return
+
+    hits = {"closed": zero_hits, "step": zero_hits_stepped}[mode]
+
+    try:
+        with open(filename, 'r') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        print("Error: 'input' file not found.")
+        return
+
+    commands = (parse_command(line.strip()) for line in lines if line.strip())
+    _, part1_count, part2_count = run_commands(commands, hits=hits)
+    return part1_count, part2_count
+
 
 if __name__ == "__main__":
-    p1, p2 = solve("input")
+    # Usage: python solve.py [input|-] [closed|step|numpy|stream|parallel]
+    filename = sys.argv[1] if len(sys.argv) > 1 else "input"
+    mode = sys.argv[2] if len(sys.argv) > 2 else "closed"
+    p1, p2 = solve(filename, mode)
     print(f"Part 1: {p1}")
     print(f"Part 2: {p2}")
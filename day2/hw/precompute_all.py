@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Pre-compute every Day 2 ROM image in a single pass
+Replaces running precompute_divisions.py, precompute_divisions_v2.py,
+precompute_results.py and solution.py --generate-hex one after another
+
+The (range, K) table is derived once and each ROM format is rendered from it:
+- divisions.hex:    V1 96-bit  x_start | x_end | valid
+- divisions_v2.hex: V2 128-bit x_start | x_end | const_k | valid
+- results.hex:      V3 64-bit  pre-computed contribution (wider inputs are rejected)
+- mem.hex:          128-bit merged ranges (end | start)
+
+A content hash of the input (and this generator) is stored next to the
+outputs; when it matches, regeneration is skipped.
+"""
+
+import hashlib
+import os
+import sys
+
+import precompute_results
+from precompute_results import (read_ranges, get_const_k, compute_x_range, K_VALUES,
+                                analyze_widths, check_widths)
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'py'))
+from solution import merge_ranges
+
+WRITE_BUFFER = 1 << 20
+
+def build_table(ranges):
+    """
+    One entry per (range, K) in ROM order: (x_start, x_end, const_k, valid, result)
+    x_start/x_end are zeroed for invalid entries, matching the V1/V2 ROMs
+    """
+    table = []
+    for range_start, range_end in ranges:
+        for k in K_VALUES:
+            const_k = get_const_k(k)
+            x_start, x_end = compute_x_range(range_start, range_end, k)
+            valid = x_start <= x_end
+            if valid:
+                # Arithmetic series sum * const_k (see compute_contribution)
+                result = ((x_start + x_end) * (x_end - x_start + 1) * const_k) // 2
+            else:
+                x_start = x_end = result = 0
+            table.append((x_start, x_end, const_k, valid, result))
+    return table
+
+def render_divisions(table):
+    # Bits [39:0] = x_start, [79:40] = x_end, 80 = valid
+    return [f"{x_start | (x_end << 40) | (int(valid) << 80):024x}\n"
+            for x_start, x_end, _, valid, _ in table]
+
+def render_divisions_v2(table):
+    # Bits [39:0] = x_start, [79:40] = x_end, [120:80] = const_k, 121 = valid
+    return [f"{x_start | (x_end << 40) | (const_k << 80) | (int(valid) << 121):032x}\n"
+            for x_start, x_end, const_k, valid, _ in table]
+
+def render_results(table):
+    return [f"{result:016x}\n" for _, _, _, _, result in table]
+
+def render_ranges(ranges):
+    # Upper 64: End, Lower 64: Start
+    return [f"{end:016x}{start:016x}\n" for start, end in merge_ranges(ranges)]
+
+def content_hash(input_file):
+    """Hash of the input text and the generators' source"""
+    digest = hashlib.sha256()
+    for path in (input_file, os.path.abspath(__file__), precompute_results.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def write_lines(path, lines):
+    with open(path, 'w', buffering=WRITE_BUFFER) as f:
+        f.writelines(lines)
+
+def generate_all(input_file, output_dir, force=False):
+    """Write every ROM image into output_dir; returns False if the cache was hit"""
+    outputs = {
+        "divisions.hex": render_divisions,
+        "divisions_v2.hex": render_divisions_v2,
+        "results.hex": render_results,
+    }
+    paths = [os.path.join(output_dir, name) for name in list(outputs) + ["mem.hex"]]
+    stamp_path = os.path.join(output_dir, ".roms.sha256")
+
+    digest = content_hash(input_file)
+    if not force and all(os.path.exists(p) for p in paths) and os.path.exists(stamp_path):
+        with open(stamp_path, 'r') as f:
+            if f.read().strip() == digest:
+                return False
+
+    ranges = read_ranges(input_file)
+    table = build_table(ranges)
+    check_widths(analyze_widths(ranges))
+    for name, render in outputs.items():
+        write_lines(os.path.join(output_dir, name), render(table))
+    write_lines(os.path.join(output_dir, "mem.hex"), render_ranges(ranges))
+
+    with open(stamp_path, 'w') as f:
+        f.write(digest + "\n")
+
+    print(f"Found {len(ranges)} ranges, {len(table)} (range, K) entries")
+    print(f"Expected total sum: {sum(entry[4] for entry in table)}")
+    return True
+
+if __name__ == "__main__":
+    input_file = "../input/input.txt"
+    output_dir = "src"
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args) > 0:
+        input_file = args[0]
+    if len(args) > 1:
+        output_dir = args[1]
+    force = '--force' in sys.argv
+
+    print(f"Reading ranges from: {input_file}")
+    if generate_all(input_file, output_dir, force):
+        print(f"Wrote ROM images to: {output_dir}")
+    else:
+        print(f"Input unchanged, ROM images in {output_dir} are up to date")
@@ -18,6 +18,9 @@ V3 ROM: Just the final results (64 bits each)
 
 import sys
 
+WORD_BITS = 64      # ROM entry and solver_v3.v accumulator width
+K_VALUES = range(1, 13)  # K = 1 to 12
+
 def read_ranges(input_file):
     """Read ranges from input file"""
     ranges = []
@@ -37,16 +40,19 @@ def get_x_bounds(k):
     x_max = 10 ** k - 1
     return x_min, x_max
 
-def get_const_k(k):
-    """Get the constant multiplier for a given K"""
-    return 10 ** k + 1
+def get_const_k(k, r=2):
+    """
+    Get the constant multiplier for a K-digit block repeated r times
+    Repunit in base 10^K: (10^(K*r) - 1) / (10^K - 1), i.e. 10^K + 1 for r = 2
+    """
+    return (10 ** (k * r) - 1) // (10 ** k - 1)
 
-def compute_contribution(range_start, range_end, k):
+def compute_x_range(range_start, range_end, k, r=2):
     """
-    Compute the COMPLETE contribution for a (range, k) pair
-    Returns the final result that would be added to the total sum
+    Clipped [x_start, x_end] of K-digit blocks whose r-fold repeat lies in the range
+    Empty when x_start > x_end
     """
-    const_k = get_const_k(k)
+    const_k = get_const_k(k, r)
     x_min, x_max = get_x_bounds(k)
 
     # Compute x_start = ceil(range_start / const_k)
@@ -59,6 +65,17 @@ def compute_contribution(range_start, range_end, k):
     x_start = max(x_start, x_min)
     x_end = min(x_end, x_max)
 
+    return x_start, x_end
+
+def compute_contribution(range_start, range_end, k, r=2):
+    """
+    Compute the COMPLETE contribution for a (range, k) pair
+    Returns the final result that would be added to the total sum
+    r is the repetition count (2 = the doubled numbers the ROM is built for)
+    """
+    const_k = get_const_k(k, r)
+    x_start, x_end = compute_x_range(range_start, range_end, k, r)
+
     # Check if valid range
     if x_start > x_end:
         return 0  # No contribution
@@ -73,19 +90,73 @@ def compute_contribution(range_start, range_end, k):
 
     return result
 
+def compute_count(range_start, range_end, k, r=2):
+    """Number of IDs a (range, k) pair contributes (companion to compute_contribution)"""
+    x_start, x_end = compute_x_range(range_start, range_end, k, r)
+    return max(0, x_end - x_start + 1)
+
+def analyze_widths(ranges):
+    """
+    Exact bit width every V3 stage needs for these ranges
+
+    x/count/series/product follow compute_contribution's datapath,
+    entry is the widest single ROM result and acc the widest running sum.
+    """
+    widths = {"x": 0, "count": 0, "series": 0, "const": 0,
+              "product": 0, "entry": 0, "acc": 0}
+    running_sum = 0
+
+    for range_start, range_end in ranges:
+        for k in K_VALUES:
+            const_k = get_const_k(k)
+            widths["const"] = max(widths["const"], const_k.bit_length())
+
+            x_start, x_end = compute_x_range(range_start, range_end, k)
+            if x_start > x_end:
+                continue
+
+            count = x_end - x_start + 1
+            series = (x_start + x_end) * count
+            product = series * const_k
+            running_sum += product // 2
+
+            widths["x"] = max(widths["x"], x_end.bit_length())
+            widths["count"] = max(widths["count"], count.bit_length())
+            widths["series"] = max(widths["series"], series.bit_length())
+            widths["product"] = max(widths["product"], product.bit_length())
+            widths["entry"] = max(widths["entry"], (product // 2).bit_length())
+            widths["acc"] = max(widths["acc"], running_sum.bit_length())
+
+    return widths
+
+def check_widths(widths):
+    """
+    Exit with an error if the ROM would not fit src/solver_v3.v
+    solver_v3.v reads one WORD_BITS entry at a time into a WORD_BITS-bit
+    accumulator, so a wider entry or running sum would silently wrap
+    """
+    if widths["entry"] > WORD_BITS or widths["acc"] > WORD_BITS:
+        print(f"ERROR: entries need {widths['entry']} bits and the running sum {widths['acc']} bits; "
+              f"solver_v3.v only handles {WORD_BITS}-bit entries and a {WORD_BITS}-bit accumulator")
+        sys.exit(1)
+
 def generate_rom_hex(ranges, output_file):
     """
     Generate ROM hex file with pre-computed results
-    Each entry is just 64 bits: the contribution to the total sum
+    Each entry is 64 bits: the contribution to the total sum
+    Inputs needing wider entries or sums are rejected (see check_widths)
 
     FPGA task: Read and accumulate. That's it!
     """
     total_check = 0
     valid_entries = 0
 
+    widths = analyze_widths(ranges)
+    check_widths(widths)
+
     with open(output_file, 'w') as f:
         for range_start, range_end in ranges:
-            for k in range(1, 13):  # K = 1 to 12
+            for k in K_VALUES:
                 result = compute_contribution(range_start, range_end, k)
 
                 if result > 0:
@@ -93,11 +164,14 @@ def generate_rom_hex(ranges, output_file):
                     total_check += result
 
                 # Write as 16 hex digits (64 bits)
-                hex_str = f"{result:016x}"
-                f.write(hex_str + "\n")
+                f.write(f"{result:016x}\n")
+
+    entry_count = len(ranges) * len(K_VALUES)
 
-    print(f"Generated ROM with {len(ranges) * 12} entries ({valid_entries} non-zero)")
-    print(f"ROM size: {len(ranges) * 12 * 64} bits = {len(ranges) * 12 * 64 // 8} bytes")
+    print(f"Generated ROM with {entry_count} entries ({valid_entries} non-zero)")
+    print(f"ROM size: {entry_count * WORD_BITS} bits = {entry_count * WORD_BITS // 8} bytes")
+    print(f"Widths: x={widths['x']} count={widths['count']} series={widths['series']} "
+          f"product={widths['product']} entry={widths['entry']} acc={widths['acc']}")
     print(f"Expected total sum: {total_check}")
     print(f"Verification: {'PASS' if total_check == 32976912643 else 'FAIL'}")
     print()
@@ -1,6 +1,16 @@
+import os
 import sys
 import bisect
 
+try:
+    import numpy as np
+except ImportError:  # only needed for IntervalIndex.query_batch
+    np = None
+
+# Closed-form (range, k) engine shared with the V3 ROM generator
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hw'))
+from precompute_results import compute_contribution, compute_count
+
 def generate_invalid_ids(max_val):
     invalid_ids = []
     # k is half length.
@@ -24,7 +34,181 @@ def generate_invalid_ids(max_val):
     invalid_ids.sort()
     return invalid_ids
 
-def solve(input_file):
+def max_half_length(max_val):
+    """Largest k whose smallest doubled number (10^(k-1) * (10^k + 1)) is <= max_val"""
+    k = 0
+    while 10**k * (10**(k + 1) + 1) <= max_val:
+        k += 1
+    return k
+
+def sum_invalid_ids(start, end, stat=compute_contribution):
+    """
+    Sum of repeated-half IDs in [start, end], O(k) via arithmetic series
+    Pass stat=compute_count to count them instead
+    """
+    return sum(stat(start, end, k)
+               for k in range(1, max_half_length(end) + 1))
+
+def mobius(n):
+    """Mobius function mu(n) by trial division"""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+def sum_repeated_ids(start, end, stat=compute_contribution):
+    """
+    Sum of IDs in [start, end] made of a block repeated any r >= 2 times,
+    each ID counted once however many (k, r) pairs generate it.
+    Pass stat=compute_count to count them instead.
+
+    For n-digit IDs let f(d) be the sum of IDs with period d (d | n), i.e.
+    compute_contribution(k=d, r=n/d). Mobius inversion over the divisors of n
+    gives the sum over proper periods as -sum(mu(n/d) * f(d)) for d | n, d < n.
+    """
+    total = 0
+    for n in range(2, len(str(end)) + 1):
+        for d in range(1, n):
+            if n % d:
+                continue
+            mu = mobius(n // d)
+            if mu:
+                total -= mu * stat(start, end, d, n // d)
+    return total
+
+def merge_ranges(ranges):
+    """Sort and merge overlapping or adjacent (start, end) ranges"""
+    ranges = sorted(ranges)
+    merged_ranges = []
+    if ranges:
+        curr_start, curr_end = ranges[0]
+        for next_start, next_end in ranges[1:]:
+            if next_start <= curr_end + 1: # Overlap or adjacent
+                 curr_end = max(curr_end, next_end)
+            else:
+                 merged_ranges.append((curr_start, curr_end))
+                 curr_start, curr_end = next_start, next_end
+        merged_ranges.append((curr_start, curr_end))
+    return merged_ranges
+
+class IntervalIndex:
+    """
+    Merged range set with prefix sums of invalid-ID sum/count per interval
+
+    F(x) = stat over [0, x] is the prefix up to the last interval ending at
+    or before x plus a closed-form partial for the interval containing x, so
+    a query over [a, b] is F(b) - F(a - 1): one bisect and at most two
+    partial intervals, independent of how many intervals lie in between.
+    """
+
+    def __init__(self, ranges, part=1):
+        self.intervals = merge_ranges(ranges)
+        self.starts = [start for start, _ in self.intervals]
+        self.ends = [end for _, end in self.intervals]
+        self.range_stat = sum_repeated_ids if part == 2 else sum_invalid_ids
+
+        self.prefix_sum = [0]
+        self.prefix_count = [0]
+        for start, end in self.intervals:
+            self.prefix_sum.append(self.prefix_sum[-1] + self.range_stat(start, end))
+            self.prefix_count.append(self.prefix_count[-1] +
+                                     self.range_stat(start, end, compute_count))
+
+    @property
+    def total_sum(self):
+        return self.prefix_sum[-1]
+
+    @property
+    def total_count(self):
+        return self.prefix_count[-1]
+
+    def _partial(self, i, x):
+        """(sum, count) of interval i clipped to [start_i, x], zero if x is before it"""
+        if i >= len(self.intervals) or self.starts[i] > x:
+            return 0, 0
+        return (self.range_stat(self.starts[i], x),
+                self.range_stat(self.starts[i], x, compute_count))
+
+    def _upto(self, x):
+        """(sum, count) of invalid IDs in the range set that are <= x"""
+        i = bisect.bisect_right(self.ends, x)
+        part_sum, part_count = self._partial(i, x)
+        return self.prefix_sum[i] + part_sum, self.prefix_count[i] + part_count
+
+    def query(self, a, b):
+        """(sum, count) of invalid IDs in the range set within [a, b]"""
+        if a > b:
+            return 0, 0
+        hi_sum, hi_count = self._upto(b)
+        lo_sum, lo_count = self._upto(a - 1)
+        return hi_sum - lo_sum, hi_count - lo_count
+
+    def query_batch(self, queries):
+        """
+        Vectorized query() over an (N, 2) array of [a, b] rows
+        Returns (sums, counts) as object arrays so totals never overflow
+        """
+        queries = np.asarray(queries, dtype=np.int64).reshape(-1, 2)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        # Sentinel start so points past the last interval never match
+        starts = np.asarray(self.starts + [np.iinfo(np.int64).max], dtype=np.int64)
+        prefix_sum = np.array(self.prefix_sum, dtype=object)
+        prefix_count = np.array(self.prefix_count, dtype=object)
+
+        def upto(x):
+            idx = np.searchsorted(ends, x, side='right')
+            sums = prefix_sum[idx]
+            counts = prefix_count[idx]
+            # Only points that fall inside an interval need a closed-form partial
+            for j in np.flatnonzero(starts[idx] <= x):
+                part_sum, part_count = self._partial(int(idx[j]), int(x[j]))
+                sums[j] += part_sum
+                counts[j] += part_count
+            return sums, counts
+
+        a, b = queries[:, 0], queries[:, 1]
+        hi_sum, hi_count = upto(b)
+        lo_sum, lo_count = upto(a - 1)
+        empty = a > b
+        hi_sum[empty] = lo_sum[empty]
+        hi_count[empty] = lo_count[empty]
+        return hi_sum - lo_sum, hi_count - lo_count
+
+def solve_enumerate(ranges, max_limit):
+    """Reference: materialise every candidate up to max_limit * 10 and bisect"""
+    # Generate candidates
+    print(f"Max limit in input: {max_limit}")
+    candidates = generate_invalid_ids(max_limit * 10) # *10 buffer since max_limit is rough
+    print(f"Generated {len(candidates)} candidate invalid IDs.")
+
+    total_sum = 0
+
+    for start, end in ranges:
+        # Find first valid >= start
+        idx_start = bisect.bisect_left(candidates, start)
+        # Find first valid > end
+        idx_end = bisect.bisect_right(candidates, end)
+        
+        subset = candidates[idx_start:idx_end]
+        for val in subset:
+            print(f"PY_ADDED: {val}")
+        s = sum(subset)
+        total_sum += s
+        
+    return total_sum
+
+def solve(input_file, mode="closed", part=1):
+    """
+    mode="closed": closed-form arithmetic series per (range, k), no candidate list
+    mode="enumerate": original candidate list + bisect reference (prints each ID)
+    part=2 counts blocks repeated any number of times (closed form only)
+    """
     with open(input_file, 'r') as f:
         data = f.read().strip()
     
@@ -43,19 +227,7 @@ def solve(input_file):
             
     
     # Merge ranges to handle overlaps and sorting
-    ranges.sort()
-    merged_ranges = []
-    if ranges:
-        curr_start, curr_end = ranges[0]
-        for next_start, next_end in ranges[1:]:
-            if next_start <= curr_end + 1: # Overlap or adjacent
-                 curr_end = max(curr_end, next_end)
-            else:
-                 merged_ranges.append((curr_start, curr_end))
-                 curr_start, curr_end = next_start, next_end
-        merged_ranges.append((curr_start, curr_end))
-    
-    ranges = merged_ranges
+    ranges = merge_ranges(ranges)
     
     # Check if HEX generation is requested
     if '--generate-hex' in sys.argv:
@@ -72,30 +244,18 @@ def solve(input_file):
         except:
             print("Error generating HEX file. Usage: ... --generate-hex <filename>")
 
-    # Generate candidates
-    print(f"Max limit in input: {max_limit}")
-    candidates = generate_invalid_ids(max_limit * 10) # *10 buffer since max_limit is rough
-    print(f"Generated {len(candidates)} candidate invalid IDs.")
-    
-    total_sum = 0
-    
-    for start, end in ranges:
-        # Find first valid >= start
-        idx_start = bisect.bisect_left(candidates, start)
-        # Find first valid > end
-        idx_end = bisect.bisect_right(candidates, end)
-        
-        subset = candidates[idx_start:idx_end]
-        for val in subset:
-            print(f"PY_ADDED: {val}")
-        s = sum(subset)
-        total_sum += s
-        
+    if mode == "closed" or part == 2:
+        total_sum = IntervalIndex(ranges, part).total_sum
+    else:
+        total_sum = solve_enumerate(ranges, max_limit)
+
     print(f"Total Sum: {total_sum}")
     return total_sum
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python solution.py <input_file> [--generate-hex <hex_file>]")
+        print("Usage: python solution.py <input_file> [--generate-hex <hex_file>] [--enumerate] [--part2]")
         sys.exit(1)
-    solve(sys.argv[1])
+    solve(sys.argv[1],
+          mode="enumerate" if '--enumerate' in sys.argv else "closed",
+          part=2 if '--part2' in sys.argv else 1)
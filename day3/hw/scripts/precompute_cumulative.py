@@ -13,103 +13,118 @@ Hardware just reads ROM[199] - trivial!
 Critical path: ROM read (5.83ns with register) + output FF (0.5ns) = fits easily in 4ns!
 """
 
+import os
 import sys
+from multiprocessing import Pool
+
+TREE_WIDTH = 128
+
+# Tree node: (max_seen, score, first_digit, valid), same fields as tree_node in tree_solver.v
+INVALID_NODE = (0, 0, 0, False)
+
+
+def leaf(d):
+    """Level 0 node for one digit (None = padding)"""
+    return INVALID_NODE if d is None else (d, 0, d, True)
+
+
+def merge(l, r):
+    """Associative tree_node combine of a left and right subtree"""
+    if not l[3]:
+        return r if r[3] else INVALID_NODE
+    if not r[3]:
+        return l
+
+    cross_score = l[0] * 10 + r[2]
+    return (max(l[0], r[0]), max(l[1], r[1], cross_score), l[2], True)
+
+
+def compute_line_levels(digits):
+    """
+    Every level of the binary reduction tree, leaves first
+    levels[n] holds the node tuples registered after tree stage n
+    """
+    nodes = [leaf(d) for d in digits]
+    levels = [nodes]
+    while len(nodes) > 1:
+        nodes = [merge(nodes[i], nodes[i + 1]) for i in range(0, len(nodes), 2)]
+        levels.append(nodes)
+    return levels
+
 
 def compute_line_score(digits):
     """
     Compute the final score for one line of 128 digits.
     """
-    nodes = []
-
-    # Level 0: Initialize with single digits
-    for d in digits:
-        if d is not None:
-            nodes.append({
-                'max_seen': d,
-                'score': 0,
-                'first_digit': d,
-                'valid': True
-            })
-        else:
-            nodes.append({
-                'max_seen': 0,
-                'score': 0,
-                'first_digit': 0,
-                'valid': False
-            })
-
-    # Tree reduction
+    nodes = [leaf(d) for d in digits]
     while len(nodes) > 1:
-        new_nodes = []
-        for i in range(0, len(nodes), 2):
-            l = nodes[i]
-            r = nodes[i + 1]
-
-            if not l['valid'] and not r['valid']:
-                new_nodes.append({
-                    'max_seen': 0,
-                    'score': 0,
-                    'first_digit': 0,
-                    'valid': False
-                })
-            elif not l['valid']:
-                new_nodes.append(r.copy())
-            elif not r['valid']:
-                new_nodes.append(l.copy())
-            else:
-                max_seen = max(l['max_seen'], r['max_seen'])
-                first_digit = l['first_digit']
-
-                cross_score = l['max_seen'] * 10 + r['first_digit']
-                if l['score'] >= r['score'] and l['score'] >= cross_score:
-                    score = l['score']
-                elif r['score'] >= l['score'] and r['score'] >= cross_score:
-                    score = r['score']
-                else:
-                    score = cross_score
-
-                new_nodes.append({
-                    'max_seen': max_seen,
-                    'score': score,
-                    'first_digit': first_digit,
-                    'valid': True
-                })
-
-        nodes = new_nodes
-
-    return nodes[0]['score'] if nodes[0]['valid'] else 0
+        nodes = [merge(nodes[i], nodes[i + 1]) for i in range(0, len(nodes), 2)]
+
+    return nodes[0][1] if nodes[0][3] else 0
+
+
+def line_digits(line):
+    """Hardware view of a line: digits zero-padded/truncated to TREE_WIDTH"""
+    digits = [int(c) for c in line if c.isdigit()]
+    digits += [0] * (TREE_WIDTH - len(digits))
+    return digits[:TREE_WIDTH]
+
+
+def print_levels(digits):
+    for n, nodes in enumerate(compute_line_levels(digits)):
+        print(f"Level {n} ({len(nodes)} nodes):")
+        for i, (max_seen, score, first_digit, valid) in enumerate(nodes):
+            print(f"  [{i:3d}] max_seen={max_seen} score={score:2d} "
+                  f"first_digit={first_digit} valid={int(valid)}")
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: precompute_cumulative.py <input_file> <output_hex>")
+    args = sys.argv[1:]
+    jobs = os.cpu_count() or 1
+    dump_line = None
+    if '--jobs' in args:
+        # --jobs <N>: worker processes for the line reduction (1 = serial)
+        idx = args.index('--jobs')
+        jobs = int(args[idx + 1])
+        del args[idx:idx + 2]
+    if '--levels' in args:
+        # --levels <line>: print every tree level of one line for debugging
+        idx = args.index('--levels')
+        dump_line = int(args[idx + 1])
+        del args[idx:idx + 2]
+
+    if len(args) < 2:
+        print("Usage: precompute_cumulative.py <input_file> <output_hex> [--jobs N] [--levels LINE]")
         sys.exit(1)
 
-    input_file = sys.argv[1]
-    output_hex = sys.argv[2]
+    input_file = args[0]
+    output_hex = args[1]
 
     # Read input lines
     with open(input_file, 'r') as f:
-        lines = f.read().strip().split('\n')
+        lines = [line for line in f.read().strip().split('\n') if line]
 
-    results = []
-    cumulative = 0
-    for line in lines:
-        if not line:
-            continue
+    digit_rows = [line_digits(line) for line in lines]
+
+    if dump_line is not None:
+        print_levels(digit_rows[dump_line])
 
-        digits = [int(c) for c in line if c.isdigit()]
-        while len(digits) < 128:
-            digits.append(0)
+    if jobs > 1:
+        with Pool(jobs) as pool:
+            scores = pool.map(compute_line_score, digit_rows,
+                              chunksize=max(1, len(digit_rows) // (jobs * 4)))
+    else:
+        scores = [compute_line_score(digits) for digits in digit_rows]
 
-        score = compute_line_score(digits[:128])
+    results = []
+    cumulative = 0
+    for score in scores:
         cumulative += score
         results.append(cumulative)
 
     # Write cumulative hex file
     with open(output_hex, 'w') as f:
-        for cum_sum in results:
-            f.write(f"{cum_sum:08x}\n")
+        f.writelines(f"{cum_sum:08x}\n" for cum_sum in results)
 
     print(f"Precomputed {len(results)} cumulative sums")
     print(f"Wrote to {output_hex}")
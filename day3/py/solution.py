@@ -1,5 +1,11 @@
 import sys
 import os
+import random
+
+try:
+    import numpy as np
+except ImportError:  # vectorized path falls back to solve_line_streaming
+    np = None
 
 def solve_line(line):
     # O(N^2) Reference Implementation
@@ -32,22 +38,128 @@ def solve_line_streaming(line):
             
     return overall_max
 
-def solve(input_str):
-    lines = input_str.strip().split('\n')
-    total = 0
-    for line in lines:
-        if not line.strip(): continue
-        val = solve_line_streaming(line)
-        # Verify with reference
-        ref = solve_line(line)
-        assert val == ref, f"Mismatch for line {line}: Streaming {val}, Ref {ref}"
-        total += val
-    return total
+def solve_line_k(line, k):
+    # O(N) Monotonic stack: lexicographically largest k-digit subsequence
+    digits = [int(c) for c in line.strip()]
+    if len(digits) < k:
+        return 0
+
+    # Each pop drops a smaller digit in favour of a larger one further right;
+    # only len - k digits can be dropped in total
+    drops = len(digits) - k
+    stack = []
+    for d in digits:
+        while drops and stack and stack[-1] < d:
+            stack.pop()
+            drops -= 1
+        stack.append(d)
+
+    return int(''.join(map(str, stack[:k])))
+
+def load_digit_matrix(data):
+    """
+    Parse every line of `data` (bytes) into a left-aligned uint8 digit matrix
+    Rows are zero-padded to the longest line; returns (matrix, line_lengths)
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newline = buf == ord('\n')
+    row_of_byte = np.cumsum(newline) - newline
+    num_rows = int(row_of_byte[-1]) + 1 if len(buf) else 0
+
+    digit_pos = np.flatnonzero((buf >= ord('0')) & (buf <= ord('9')))
+    rows = row_of_byte[digit_pos]
+    lengths = np.bincount(rows, minlength=num_rows)
+    # Column = rank of the digit within its row
+    cols = np.arange(len(digit_pos)) - (np.cumsum(lengths) - lengths)[rows]
+
+    width = int(lengths.max()) if num_rows else 0
+    matrix = np.zeros((num_rows, width), dtype=np.uint8)
+    matrix[rows, cols] = buf[digit_pos] - ord('0')
+    return matrix, lengths
+
+def solve_matrix(matrix, lengths):
+    """
+    Vectorized solve_line_streaming over every row at once
+    Best score per row is max(prefix_max[j-1] * 10 + digit[j]) over valid j
+    """
+    if matrix.shape[1] < 2:
+        return np.zeros(matrix.shape[0], dtype=np.int64)
+    prefix_max = np.maximum.accumulate(matrix, axis=1)
+    scores = prefix_max[:, :-1].astype(np.int64) * 10 + matrix[:, 1:]
+    # Pair ending at column j only exists if j is inside the line
+    valid = np.arange(1, matrix.shape[1]) < lengths[:, None]
+    return np.where(valid, scores, 0).max(axis=1)
+
+def solve_matrix_k(matrix, lengths, k):
+    """
+    Batched solve_line_k over every row: k greedy picks, each the leftmost
+    max digit in [previous pick + 1, length - remaining picks]
+    Returns Python ints (rows shorter than k score 0)
+    """
+    num_rows, width = matrix.shape
+    if width < k:
+        return [0] * num_rows
+    rows = np.arange(num_rows)
+    cols = np.arange(width)
+    start = np.zeros(num_rows, dtype=np.int64)
+    values = np.zeros(num_rows, dtype=object)
+
+    for pick in range(k):
+        stop = lengths - (k - pick)  # last column this pick may use
+        window = (cols >= start[:, None]) & (cols <= stop[:, None])
+        idx = np.argmax(np.where(window, matrix.astype(np.int8), np.int8(-1)), axis=1)
+        values = values * 10 + matrix[rows, idx].astype(object)
+        start = idx + 1
+
+    values[lengths < k] = 0
+    return values.tolist()
+
+def line_scores(input_str, k=2):
+    """Score of every line, vectorized when NumPy is available"""
+    if np is not None:
+        matrix, lengths = load_digit_matrix(input_str.strip().encode())
+        if k == 2:
+            return solve_matrix(matrix, lengths).tolist()
+        return solve_matrix_k(matrix, lengths, k)
+    if k == 2:
+        return [solve_line_streaming(line) for line in input_str.strip().split('\n')]
+    return [solve_line_k(line, k) for line in input_str.strip().split('\n')]
+
+def solve(input_str, verify_sample=0, k=2):
+    """
+    Total joltage over all lines, picking k digits per line
+    verify_sample > 0 cross-checks that many random lines against a reference:
+    the O(N^2) solve_line for k=2 (opt-in: it is quadratic per line),
+    the solve_line_k stack otherwise
+    """
+    scores = line_scores(input_str, k)
+
+    if verify_sample:
+        lines = input_str.strip().split('\n')
+        for i in random.sample(range(len(lines)), min(verify_sample, len(lines))):
+            if not lines[i].strip(): continue
+            ref = solve_line(lines[i]) if k == 2 else solve_line_k(lines[i], k)
+            assert scores[i] == ref, f"Mismatch for line {lines[i]}: Fast {scores[i]}, Ref {ref}"
+
+    return sum(scores)
 
 if __name__ == '__main__':
     input_path = '../input/input.txt'
-    if len(sys.argv) > 1:
-        input_path = sys.argv[1]
+    verify_sample = 0
+    k = 2
+    args = sys.argv[1:]
+    if '--verify' in args:
+        # --verify <N>: cross-check N random lines against the O(N^2) reference
+        idx = args.index('--verify')
+        verify_sample = int(args[idx + 1])
+        del args[idx:idx + 2]
+    if '--digits' in args:
+        # --digits <K>: pick K digits per line instead of 2
+        idx = args.index('--digits')
+        k = int(args[idx + 1])
+        del args[idx:idx + 2]
+    if args:
+        input_path = args[0]
     
     if not os.path.exists(input_path):
         print(f"Error: Input file not found at {input_path}")
@@ -58,6 +170,6 @@ if __name__ == '__main__':
     if os.path.exists(input_path):
         with open(input_path, 'r') as f:
             print(f"Solving {input_path}...")
-            print(f"Total Output Joltage: {solve(f.read())}")
+            print(f"Total Output Joltage: {solve(f.read(), verify_sample, k)}")
     else:
         print("No input file found.")
@@ -3,38 +3,22 @@
 Generate Verilog ROM module with hardcoded neighbor count data
 """
 
-def generate_rom_verilog(input_file, output_file):
-    """Generate Verilog ROM with neighbor counts"""
-    with open(input_file, 'r') as f:
-        grid = [list(line.strip()) for line in f.readlines()]
-
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    # For part 1: each cell with @
-    rom_data = []
+import os
+import sys
 
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] != '@':
-                continue
+# Shared neighbor-count engine (day4/py/solution.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'py'))
+from solution import precompute
 
-            neighbor_count = 0
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
+def load_rom_data(input_file):
+    """1 per '@' cell with < 4 neighbors, 0 otherwise (row-major)"""
+    with open(input_file, 'r') as f:
+        return precompute(f.read())['rom_data']
 
-            # Store: 1 if < 4 neighbors, 0 otherwise
-            if neighbor_count < 4:
-                rom_data.append(1)
-            else:
-                rom_data.append(0)
+def generate_rom_verilog(input_file, output_file, rom_data=None):
+    """Generate Verilog ROM with neighbor counts"""
+    if rom_data is None:
+        rom_data = load_rom_data(input_file)
 
     # Generate Verilog
     depth = len(rom_data)
@@ -81,38 +65,10 @@ endmodule
     print(f"  Sum: {sum(rom_data)}")
     return rom_data
 
-def generate_rom_verilog_simple(input_file, output_file):
+def generate_rom_verilog_simple(input_file, output_file, rom_data=None):
     """Generate Verilog ROM with individual assignments"""
-    with open(input_file, 'r') as f:
-        grid = [list(line.strip()) for line in f.readlines()]
-
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    # For part 1: each cell with @
-    rom_data = []
-
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] != '@':
-                continue
-
-            neighbor_count = 0
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
-
-            # Store: 1 if < 4 neighbors, 0 otherwise
-            if neighbor_count < 4:
-                rom_data.append(1)
-            else:
-                rom_data.append(0)
+    if rom_data is None:
+        rom_data = load_rom_data(input_file)
 
     # Generate Verilog with individual assignments
     depth = len(rom_data)
@@ -3,94 +3,48 @@
 Day 4: Precompute neighbor counts for each cell
 Part 1: Count cells with < 4 neighbors (initial pass)
 Part 2: Iteratively remove cells with < 4 neighbors until stable
-"""
-
-def solve_part1(grid):
-    """Find cells with < 4 neighbors"""
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    count = 0
-    results = []  # (row, col, neighbor_count) for debugging
-
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] != '@':
-                continue
-
-            neighbor_count = 0
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
-
-            if neighbor_count < 4:
-                count += 1
-                results.append((r, c, neighbor_count))
-
-    return count, results
-
-def solve_part2(input_str):
-    """Iteratively remove cells with < 4 neighbors"""
-    grid = [list(line.strip()) for line in input_str.strip().split('\n')]
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    total_removed = 0
-    iteration = 0
-
-    while True:
-        to_remove = []
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != '@':
-                    continue
-
-                neighbor_count = 0
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        if dr == 0 and dc == 0:
-                            continue
-
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < rows and 0 <= nc < cols:
-                            if grid[nr][nc] == '@':
-                                neighbor_count += 1
-
-                if neighbor_count < 4:
-                    to_remove.append((r, c))
 
-        if not to_remove:
-            break
+Single-pass driver: the grid is parsed once by day4/py/solution.py's
+precompute() and every artifact is written from that one result:
+- hw/scripts/day4_part1.txt, day4_part2.txt: expected answers
+- hw/scripts/day4_rom.hex, day4_rom.txt:    per-roll accessible flags
+- hw/src/rom_day4_auto.v:                   the same flags as a Verilog ROM
+followed by the py/verify_hex.py report
+Run from the day4/ directory.
+"""
 
-        total_removed += len(to_remove)
-        for r, c in to_remove:
-            grid[r][c] = '.'
+import os
+import sys
 
-        iteration += 1
-        print(f"Iteration {iteration}: Removed {len(to_remove)} cells, Total: {total_removed}")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from gen_neighbor_rom import write_rom_files
+from gen_rom_verilog import generate_rom_verilog_simple
 
-    return total_removed
+PY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'py')
+sys.path.append(PY_DIR)
+from solution import precompute
+import verify_hex
 
 if __name__ == '__main__':
+    input_file = 'input/input.txt'
+
     # Read input
-    with open('input/input.txt', 'r') as f:
+    with open(input_file, 'r') as f:
         input_str = f.read()
 
-    grid = [list(line.strip()) for line in input_str.strip().split('\n')]
+    result = precompute(input_str)
 
     # Part 1
-    count1, results = solve_part1(grid)
+    count1 = result['part1']
     print(f"Part 1: {count1}")
-    print(f"Results preview: {results[:5]}")
+    print(f"Results preview: {result['hits'][:5]}")
 
     # Part 2
-    count2 = solve_part2(input_str)
+    total_removed = 0
+    for iteration, removed in enumerate(result['waves'], 1):
+        total_removed += removed
+        print(f"Iteration {iteration}: Removed {removed} cells, Total: {total_removed}")
+    count2 = result['part2']
     print(f"Part 2: {count2}")
 
     # Generate ROM data (simple format: one count per line)
@@ -100,6 +54,15 @@ if __name__ == '__main__':
     with open('hw/scripts/day4_part2.txt', 'w') as f:
         f.write(str(count2) + '\n')
 
+    rom_data = result['rom_data']
+    write_rom_files(rom_data, 'hw/scripts/day4_rom.hex', 'hw/scripts/day4_rom.txt')
+    generate_rom_verilog_simple(input_file, 'hw/src/rom_day4_auto.v', rom_data)
+
     print("\nGenerated:")
     print(f"  day4_part1.txt: {count1}")
     print(f"  day4_part2.txt: {count2}")
+    print(f"  day4_rom.hex / day4_rom.txt: {len(rom_data)} entries")
+
+    print("\nVerify:")
+    verify_hex.report(input_file, 'input/input.hex',
+                      os.path.join(PY_DIR, 'py_out.txt'), result=result)
@@ -0,0 +1,46 @@
+import os
+import random
+import sys
+import tempfile
+
+from solution import solve, solve_part2, solve_tiled, solve_part2_tiled
+
+# Cross-check the tiled (memory-mapped) engine against the in-memory solvers
+
+def random_grid(rows, cols, seed=0, density=0.6):
+    rng = random.Random(seed)
+    return '\n'.join(''.join('@' if rng.random() < density else '.' for _ in range(cols))
+                     for _ in range(rows)) + '\n'
+
+def check(name, content, band_cells=None):
+    """Solve `content` both ways; True when both parts agree"""
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write(content)
+    try:
+        kwargs = {'band_cells': band_cells} if band_cells else {}
+        expected = (solve(content), solve_part2(content))
+        got = (solve_tiled(f.name, **kwargs), solve_part2_tiled(f.name, **kwargs))
+    finally:
+        os.unlink(f.name)
+
+    ok = expected == got
+    print(f"{name}: in-memory {expected}, tiled {got} {'OK' if ok else 'MISMATCH'}")
+    return ok
+
+def report(input_path='../input/input.txt'):
+    cases = [
+        ("random 64x64, small bands", random_grid(64, 64, seed=1), 256),
+        # First row wider than any fixed search window for the row stride
+        ("wide 4x70000", random_grid(4, 70000, seed=2), None),
+        ("CRLF 20x30", random_grid(20, 30, seed=3).replace('\n', '\r\n'), 64),
+    ]
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as f:
+            cases.append((input_path, f.read(), 1 << 12))
+
+    results = [check(name, content, band_cells) for name, content, band_cells in cases]
+    print("All tiled checks passed" if all(results) else "Tiled checks FAILED")
+    return all(results)
+
+if __name__ == '__main__':
+    sys.exit(0 if report() else 1)
@@ -1,7 +1,133 @@
 import sys
 import os
+import mmap
+import tempfile
 
-def solve(input_str):
+try:
+    import numpy as np
+except ImportError:  # vectorized engine falls back to the per-cell loop
+    np = None
+
+NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+def parse_grid(input_str):
+    """Grid as a 2-D boolean array, True where a roll ('@') sits"""
+    lines = [line.strip() for line in input_str.strip().split('\n')]
+    flat = np.frombuffer(''.join(lines).encode(), dtype=np.uint8)
+    return (flat == ord('@')).reshape(len(lines), -1)
+
+def neighbor_counts(grid):
+    """
+    8-neighbour '@' counts for every cell of a boolean grid
+    Separable 3x3 box sum over a zero-padded copy, minus the centre cell
+    """
+    padded = np.pad(grid, 1).astype(np.uint8)
+    rows3 = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+    box = rows3[:-2] + rows3[1:-1] + rows3[2:]
+    return box - grid
+
+def accessible_mask(grid, counts=None):
+    """Rolls with fewer than 4 neighbouring rolls"""
+    if counts is None:
+        counts = neighbor_counts(grid)
+    return grid & (counts < 4)
+
+# Bitboard backend: one Python int per row, bit c set where column c holds '@'
+BIT_TABLE = bytes(ord('1') if b == ord('@') else ord('0') for b in range(256))
+
+def parse_bitboard(input_str):
+    """Grid as a list of row ints plus the row width"""
+    lines = [line.strip() for line in input_str.strip().split('\n')]
+    width = len(lines[0]) if lines else 0
+    # Reverse so column 0 lands in bit 0
+    board = [int(line.encode()[::-1].translate(BIT_TABLE) or b'0', 2) for line in lines]
+    return board, width
+
+def full_add(a, b, c):
+    """Bitwise full adder over every column at once: (sum, carry)"""
+    return a ^ b ^ c, (a & b) | (c & (a ^ b))
+
+def count_planes(above, row, below, mask):
+    """
+    Bit-sliced 8-neighbour count of every column of `row`
+    Same carry-save adder tree as the hardware window sum;
+    returns the count's bit planes (b0, b1, b2, b3)
+    """
+    # Neighbour at column c - 1 shifts up into bit c, c + 1 shifts down
+    s_a, c_a = full_add((above << 1) & mask, above, above >> 1)
+    s_b, c_b = full_add((below << 1) & mask, below, below >> 1)
+    left, right = (row << 1) & mask, row >> 1
+    s_c, c_c = left ^ right, left & right
+
+    b0, c_d = full_add(s_a, s_b, s_c)
+    s_e, f_a = full_add(c_a, c_b, c_c)
+    b1, f_b = s_e ^ c_d, s_e & c_d
+    return b0, b1, f_a ^ f_b, f_a & f_b
+
+def accessible_bits(above, row, below, mask):
+    """Rolls in `row` with fewer than 4 neighbours (count bit 2 and 3 clear)"""
+    _, _, b2, b3 = count_planes(above, row, below, mask)
+    return row & ~(b2 | b3)
+
+def solve_bitboard(input_str, debug=None):
+    """Part 1 on the bitboard backend"""
+    board, width = parse_bitboard(input_str)
+    mask = (1 << width) - 1
+    padded = [0] + board + [0]
+
+    count = 0
+    for r in range(len(board)):
+        above, row, below = padded[r], padded[r + 1], padded[r + 2]
+        b0, b1, b2, b3 = count_planes(above, row, below, mask)
+        hits = row & ~(b2 | b3)
+        count += bin(hits).count('1')
+        if debug:
+            while hits:
+                c = (hits & -hits).bit_length() - 1
+                hits &= hits - 1
+                neighbor_count = sum(((plane >> c) & 1) << i for i, plane in enumerate((b0, b1, b2, b3)))
+                debug(r, c, neighbor_count)
+    return count
+
+def print_hit(r, c, neighbor_count):
+    """Debug sink matching the hardware log format (see compare_day4.py)"""
+    print(f"Py: Found at Row {r} Col {c} (Neighbors {neighbor_count})")
+
+DEFAULT_BACKEND = "numpy" if np is not None else "bitboard"
+
+def solve(input_str, debug=None, backend=DEFAULT_BACKEND):
+    """
+    Part 1 count of accessible rolls
+    debug, if given, is called as debug(row, col, neighbor_count) per hit
+    backend is "numpy", "bitboard" or "reference"
+    """
+    if backend == "bitboard":
+        return solve_bitboard(input_str, debug)
+    if backend == "reference":
+        return solve_reference(input_str, debug)
+
+    grid = parse_grid(input_str)
+    counts = neighbor_counts(grid)
+    mask = accessible_mask(grid, counts)
+    if debug:
+        for r, c in np.argwhere(mask):
+            debug(int(r), int(c), int(counts[r, c]))
+    return int(np.count_nonzero(mask))
+
+def reference_neighbor_count(grid, r, c):
+    """8-neighbour '@' count of one cell of a list-of-lists grid"""
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    neighbor_count = 0
+    for dr, dc in NEIGHBOR_OFFSETS:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < rows and 0 <= nc < cols:
+            if grid[nr][nc] == '@':
+                neighbor_count += 1
+    return neighbor_count
+
+def solve_reference(input_str, debug=None):
+    # Per-cell reference implementation
     grid = [list(line.strip()) for line in input_str.strip().split('\n')]
     rows = len(grid)
     cols = len(grid[0]) if rows > 0 else 0
@@ -13,26 +139,249 @@ def solve(input_str):
             if grid[r][c] != '@':
                 continue
                 
-            neighbor_count = 0
-            # Check 8 neighbors
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    
-                    nr, nc = r + dr, c + dc
-                    
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
-            
+            neighbor_count = reference_neighbor_count(grid, r, c)
             if neighbor_count < 4:
                 count += 1
-                print(f"Py: Found at Row {r} Col {c} (Neighbors {neighbor_count})")
+                if debug:
+                    debug(r, c, neighbor_count)
                 
     return count
 
-def solve_part2(input_str):
+def peel(grid, removable=None):
+    """
+    Worklist peeling (k-core style) of a boolean grid
+    Neighbour counts are computed once; removing a wave only decrements the
+    neighbours of the removed cells, and any roll whose count drops below 4
+    joins the next wave. Waves match the full-rescan iterations one to one.
+    Only cells set in `removable` may be removed (default: all of them).
+    Returns (removed per wave, peeled grid).
+    """
+    rows, cols = grid.shape
+    width = cols + 2
+    # Flat indices into a zero-padded grid so border cells need no checks
+    alive = np.pad(grid, 1).ravel()
+    counts = np.pad(neighbor_counts(grid), 1).astype(np.int16).ravel()
+    offsets = np.array([dr * width + dc for dr, dc in NEIGHBOR_OFFSETS])
+    may_remove = alive.copy() if removable is None else np.pad(removable, 1).ravel()
+
+    wave = np.flatnonzero(alive & may_remove & (counts < 4))
+    waves = []
+    while len(wave):
+        waves.append(len(wave))
+        alive[wave] = False
+
+        neighbors = (wave[:, None] + offsets).ravel()
+        np.subtract.at(counts, neighbors, 1)
+
+        # Live rolls that just dropped below 4 (each counted once)
+        neighbors = np.unique(neighbors)
+        wave = neighbors[alive[neighbors] & may_remove[neighbors] & (counts[neighbors] < 4)]
+    return waves, alive.reshape(rows + 2, width)[1:-1, 1:-1]
+
+def peel_waves(grid):
+    """Number of rolls removed in each Part 2 wave (see peel())"""
+    return peel(grid)[0]
+
+def peel_waves_bitboard(board, width):
+    """
+    peel_waves() on the bitboard backend
+    Each wave re-evaluates only rows next to a row that lost rolls
+    """
+    mask = (1 << width) - 1
+    padded = [0] + board + [0]
+    dirty = range(1, len(board) + 1)
+
+    waves = []
+    while True:
+        # Decide the whole wave before removing anything
+        removals = {}
+        for i in dirty:
+            hits = accessible_bits(padded[i - 1], padded[i], padded[i + 1], mask)
+            if hits:
+                removals[i] = hits
+        if not removals:
+            return waves
+
+        waves.append(sum(bin(hits).count('1') for hits in removals.values()))
+        for i, hits in removals.items():
+            padded[i] &= ~hits
+        dirty = sorted({j for i in removals for j in (i - 1, i, i + 1) if 0 < j <= len(board)})
+
+def solve_part2(input_str, debug=None, backend=DEFAULT_BACKEND):
+    """
+    Part 2 total of rolls removed by repeated peeling
+    debug, if given, is called as debug(wave, removed) per wave
+    backend is "numpy", "bitboard" or "reference"
+    """
+    if backend == "reference":
+        return solve_part2_reference(input_str)
+    if backend == "bitboard":
+        waves = peel_waves_bitboard(*parse_bitboard(input_str))
+    else:
+        waves = peel_waves(parse_grid(input_str))
+    if debug:
+        for i, removed in enumerate(waves, 1):
+            debug(i, removed)
+    return sum(waves)
+
+# Tiled out-of-core engine: the input file is memory-mapped and processed in
+# horizontal bands of about BAND_CELLS cells, each with a one-row halo
+BAND_CELLS = 1 << 22
+
+def map_grid(f):
+    """
+    Memory-map an open binary grid file as a (rows, cols) uint8 view
+    Rows are strided over the newlines; nothing is read until a band is touched
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buf = np.frombuffer(mapped, dtype=np.uint8)
+
+    # The first row may be any width, so search the whole mapping
+    newline = mapped.find(b'\n')
+    if newline < 0:
+        newline = len(buf)
+    cols = newline - (1 if newline and buf[newline - 1] == ord('\r') else 0)
+    stride = newline + 1
+
+    # Ignore trailing newlines / blank lines; the last row has no terminator
+    size = len(buf)
+    while size and buf[size - 1] in b'\r\n ':
+        size -= 1
+    rows = (size + stride - cols) // stride
+    if size != (rows - 1) * stride + cols:
+        raise ValueError(f"Grid rows are not all {cols} wide (line stride {stride}, {size} bytes)")
+    return np.lib.stride_tricks.as_strided(buf, shape=(rows, cols), strides=(stride, 1))
+
+def band_bounds(rows, cols, band_cells=BAND_CELLS):
+    """[start, end) row ranges of the bands"""
+    band_rows = max(1, band_cells // max(cols, 1))
+    return [(a, min(a + band_rows, rows)) for a in range(0, rows, band_rows)]
+
+def halo_band(grid, a, e):
+    """Rows [a, e) of grid plus one halo row each side (zeros past the edges)"""
+    lo, hi = max(a - 1, 0), min(e + 1, len(grid))
+    return np.pad(grid[lo:hi], ((lo - (a - 1), (e + 1) - hi), (0, 0)))
+
+def accessible_bands(view, band_cells=BAND_CELLS):
+    """
+    Stream Part 1 band by band from a mapped grid
+    Yields (first_row, counts, mask) per band; only one band is in memory
+    """
+    rows, cols = view.shape
+    for a, e in band_bounds(rows, cols, band_cells):
+        band = halo_band(view, a, e) == ord('@')
+        counts = neighbor_counts(band)[1:-1]
+        yield a, counts, band[1:-1] & (counts < 4)
+
+def solve_tiled(path, debug=None, band_cells=BAND_CELLS):
+    """Part 1 straight from a file with O(band x width) memory"""
+    count = 0
+    with open(path, 'rb') as f:
+        for a, counts, mask in accessible_bands(map_grid(f), band_cells):
+            count += int(np.count_nonzero(mask))
+            if debug:
+                for r, c in np.argwhere(mask):
+                    debug(a + int(r), int(c), int(counts[r, c]))
+    return count
+
+def peel_tiled(view, band_cells=BAND_CELLS, scratch_dir=None):
+    """
+    Part 2 total on a mapped grid, one band at a time
+    The live-roll state is kept in a scratch file. Each band is peeled to a
+    fixpoint with its halo rows frozen; if a band's edge row loses rolls the
+    neighbouring band is queued again. Peeling is order independent, so the
+    total equals the synchronous waves of peel_waves().
+    """
+    rows, cols = view.shape
+    if not rows or not cols:
+        return 0
+    bounds = band_bounds(rows, cols, band_cells)
+
+    with tempfile.TemporaryFile(dir=scratch_dir) as scratch:
+        state = np.memmap(scratch, dtype=bool, mode='w+', shape=(rows, cols))
+        for a, e in bounds:
+            state[a:e] = view[a:e] == ord('@')
+
+        removable = None
+        removed = 0
+        pending = set(range(len(bounds)))
+        while pending:
+            i = min(pending)
+            pending.discard(i)
+            a, e = bounds[i]
+
+            band = halo_band(state, a, e)
+            if removable is None or removable.shape != band.shape:
+                removable = np.ones_like(band)
+                removable[[0, -1]] = False
+            waves, alive = peel(band, removable)
+            if not waves:
+                continue
+
+            removed += sum(waves)
+            # Boundary changes wake the neighbouring band
+            if i > 0 and (alive[1] != band[1]).any():
+                pending.add(i - 1)
+            if i + 1 < len(bounds) and (alive[-2] != band[-2]).any():
+                pending.add(i + 1)
+            state[a:e] = alive[1:-1]
+        del state
+    return removed
+
+def solve_part2_tiled(path, band_cells=BAND_CELLS, scratch_dir=None):
+    """Part 2 straight from a file; see peel_tiled()"""
+    with open(path, 'rb') as f:
+        return peel_tiled(map_grid(f), band_cells, scratch_dir)
+
+def precompute(input_str, backend=DEFAULT_BACKEND):
+    """
+    Everything the ROM/hex generators need, from a single grid parse
+    Returns a dict with rows, cols, part1, part2, waves (removed per Part 2
+    wave), hits [(row, col, neighbor_count)] and rom_data (1 if accessible,
+    0 otherwise, for every roll in row-major order)
+    """
+    hits = []
+    rom_data = []
+
+    if backend == "numpy":
+        grid = parse_grid(input_str)
+        rows, cols = grid.shape
+        counts = neighbor_counts(grid)
+        mask = accessible_mask(grid, counts)
+        rom_data = mask[grid].astype(np.uint8).tolist()
+        hits = [(int(r), int(c), int(counts[r, c])) for r, c in np.argwhere(mask)]
+        waves = peel_waves(grid)
+    else:
+        board, cols = parse_bitboard(input_str)
+        rows = len(board)
+        solve_bitboard(input_str, lambda r, c, n: hits.append((r, c, n)))
+        hit_bits = [0] * rows
+        for r, c, _ in hits:
+            hit_bits[r] |= 1 << c
+        for row, row_hits in zip(board, hit_bits):
+            while row:
+                low = row & -row
+                rom_data.append(1 if row_hits & low else 0)
+                row ^= low
+        waves = peel_waves_bitboard(board, cols)
+
+    return {
+        "rows": rows,
+        "cols": cols,
+        "part1": len(hits),
+        "part2": sum(waves),
+        "waves": waves,
+        "hits": hits,
+        "rom_data": rom_data,
+    }
+
+def print_wave(wave, removed):
+    print(f"Py: Wave {wave} removed {removed}")
+
+def solve_part2_reference(input_str):
+    # Full-rescan reference implementation
     grid = [list(line.strip()) for line in input_str.strip().split('\n')]
     rows = len(grid)
     cols = len(grid[0]) if rows > 0 else 0
@@ -46,18 +395,7 @@ def solve_part2(input_str):
                 if grid[r][c] != '@':
                     continue
                 
-                neighbor_count = 0
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        if dr == 0 and dc == 0:
-                            continue
-                        
-                        nr, nc = r + dr, c + dc
-                        
-                        if 0 <= nr < rows and 0 <= nc < cols:
-                            if grid[nr][nc] == '@':
-                                neighbor_count += 1
-                
+                neighbor_count = reference_neighbor_count(grid, r, c)
                 if neighbor_count < 4:
                     to_remove.append((r, c))
         
@@ -72,8 +410,19 @@ def solve_part2(input_str):
 
 if __name__ == '__main__':
     input_path = '../input/input.txt'
-    if len(sys.argv) > 1:
-        input_path = sys.argv[1]
+    args = [arg for arg in sys.argv[1:] if arg not in ('--debug', '--tiled')]
+    # --debug: log every accessible roll as "Py: Found at ..." and each Part 2 wave
+    debug = '--debug' in sys.argv
+    # --tiled: memory-map the file and work band by band (grids larger than RAM)
+    tiled = '--tiled' in sys.argv
+    backend = DEFAULT_BACKEND
+    if '--backend' in args:
+        # --backend numpy|bitboard|reference
+        idx = args.index('--backend')
+        backend = args[idx + 1]
+        del args[idx:idx + 2]
+    if args:
+        input_path = args[0]
     
     if not os.path.exists(input_path):
         print(f"Error: Input file not found at {input_path}")
@@ -81,11 +430,15 @@ if __name__ == '__main__':
         input_path = '../input/example.txt'
         print(f"Trying example file at {input_path}")
     
-    if os.path.exists(input_path):
+    if os.path.exists(input_path) and tiled:
+        print(f"Solving {input_path} (tiled)...")
+        print(f"Part 1 - Total Accessible Paper Rolls: {solve_tiled(input_path, print_hit if debug else None)}")
+        print(f"Part 2 - Total Removed Paper Rolls: {solve_part2_tiled(input_path)}")
+    elif os.path.exists(input_path):
         with open(input_path, 'r') as f:
             content = f.read()
             print(f"Solving {input_path}...")
-            print(f"Part 1 - Total Accessible Paper Rolls: {solve(content)}")
-            print(f"Part 2 - Total Removed Paper Rolls: {solve_part2(content)}")
+            print(f"Part 1 - Total Accessible Paper Rolls: {solve(content, print_hit if debug else None, backend)}")
+            print(f"Part 2 - Total Removed Paper Rolls: {solve_part2(content, print_wave if debug else None, backend)}")
     else:
         print("No input file found.")
@@ -2,48 +2,27 @@
 """
 Generate Verilog ROM for Day 5
 Each ROM entry contains 1 if ID matches a range, 0 otherwise
-"""
-
-def parse_input(filename):
-    with open(filename, 'r') as f:
-        content = f.read().strip()
-
-    parts = content.split('\n\n')
-    range_lines = parts[0].split('\n')
-    id_lines = parts[1].split('\n')
 
-    ranges = []
-    for line in range_lines:
-        start, end = map(int, line.split('-'))
-        ranges.append((start, end))
+Also emits the range-tree ROM for log-depth lookup: the merged ranges in
+Eytzinger order (see RangeTree in day5/py/solution.py) plus its
+pipeline parameters
+"""
 
-    ids = []
-    for line in id_lines:
-        ids.append(int(line))
+import os
+import sys
 
-    return ranges, ids
+# Shared range index (day5/py/solution.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'py'))
+from solution import parse_input, RangeIndex, RangeTree, KEY_BITS
 
 def generate_rom_verilog_day5(input_file, output_file):
     """Generate Verilog ROM for Day 5"""
     ranges, ids = parse_input(input_file)
 
-    rom_data = []
-    count = 0
-
     print(f"Processing {len(ids)} IDs against {len(ranges)} ranges...")
 
-    for id_val in ids:
-        is_fresh = False
-        for start, end in ranges:
-            if start <= id_val <= end:
-                is_fresh = True
-                break
-
-        if is_fresh:
-            rom_data.append(1)
-            count += 1
-        else:
-            rom_data.append(0)
+    rom_data = [1 if is_fresh else 0 for is_fresh in RangeIndex(ranges).fresh_mask(ids)]
+    count = sum(rom_data)
 
     depth = len(rom_data)
 
@@ -90,5 +69,35 @@ endmodule
     print(f"  Count: {count}")
     return rom_data, count
 
+def generate_range_tree(input_file, hex_file, params_file):
+    """
+    Range-tree ROM: one "START END" line per node (ranges.hex format),
+    node k at address k - 1, one tree level per pipeline stage
+    """
+    ranges, ids = parse_input(input_file)
+    tree = RangeTree(ranges)
+
+    with open(hex_file, 'w') as f:
+        for start, end in tree.nodes:
+            f.write(f"{start:016X} {end:016X}\n")
+
+    with open(params_file, 'w') as f:
+        f.write(f"localparam KEY_BITS = {KEY_BITS};\n")
+        f.write(f"localparam TREE_DEPTH = {tree.depth};\n")
+        f.write(f"localparam TREE_NODES = {len(tree.nodes)};\n")
+        # One stage per level, then the candidate end compare
+        f.write(f"localparam TREE_STAGES = {tree.depth + 1};\n")
+
+    # Cross-check the traversal model against the interval index
+    count = tree.count(ids)
+    expected = RangeIndex(ranges).count(ids)
+
+    print(f"Generated {hex_file} and {params_file}")
+    print(f"  Ranges: {len(ranges)} -> {len(RangeIndex(ranges).intervals)} merged")
+    print(f"  Nodes: {len(tree.nodes)} ({tree.depth} levels, {tree.depth + 1} pipeline stages)")
+    print(f"  Tree model count: {count} ({'PASS' if count == expected else 'FAIL'})")
+    return tree, count
+
 if __name__ == '__main__':
     rom_data, count = generate_rom_verilog_day5('input/input.txt', 'hw/src/rom_day5_auto.v')
+    generate_range_tree('input/input.txt', 'input/ranges_tree.hex', 'hw/src/tree_params.vh')
@@ -4,42 +4,21 @@ Day 5: Precompute which IDs fall within which ranges
 For each ID, check if it matches any range (start <= id <= end)
 """
 
-def parse_input(filename):
-    with open(filename, 'r') as f:
-        content = f.read().strip()
+import os
+import sys
 
-    parts = content.split('\n\n')
-    range_lines = parts[0].split('\n')
-    id_lines = parts[1].split('\n')
-
-    ranges = []
-    for line in range_lines:
-        start, end = map(int, line.split('-'))
-        ranges.append((start, end))
-
-    ids = []
-    for line in id_lines:
-        ids.append(int(line))
-
-    return ranges, ids
+# Shared range index (day5/py/solution.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'py'))
+from solution import parse_input, RangeIndex
 
 def solve(filename):
     ranges, ids = parse_input(filename)
 
-    count = 0
-    matches = []
-
-    for id_val in ids:
-        is_fresh = False
-        for start, end in ranges:
-            if start <= id_val <= end:
-                is_fresh = True
-                break
-        if is_fresh:
-            count += 1
-            matches.append(id_val)
+    # One binary search per ID against the merged ranges
+    fresh = RangeIndex(ranges).fresh_mask(ids)
+    matches = [id_val for id_val, is_fresh in zip(ids, fresh) if is_fresh]
 
-    return count, matches
+    return len(matches), matches
 
 if __name__ == '__main__':
     # Read input
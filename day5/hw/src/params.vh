@@ -1,2 +1,3 @@
 localparam NUM_RANGES = 174;
 localparam NUM_IDS = 1000;
+localparam NUM_MERGED = 80;
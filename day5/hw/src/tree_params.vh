@@ -0,0 +1,4 @@
+localparam KEY_BITS = 64;
+localparam TREE_DEPTH = 7;
+localparam TREE_NODES = 127;
+localparam TREE_STAGES = 8;
@@ -22,9 +22,16 @@ async def test_day5_solution(dut):
     # 2. Run Python Reference
     sys.path.append(sw_dir)
     try:
-        from solution import solve
+        from solution import solve, parse_input, RangeTree
         exp_count = solve(input_path)
         dut._log.info(f"Python Reference Count: {exp_count}")
+
+        # Cross-check the range-tree traversal model (ranges_tree.hex layout)
+        ranges, ids = parse_input(input_path)
+        tree = RangeTree(ranges)
+        tree_count = tree.count(ids)
+        dut._log.info(f"Range-Tree Model Count: {tree_count} ({tree.depth} levels)")
+        assert tree_count == exp_count, f"Mismatch: Tree={tree_count}, Exp={exp_count}"
     except ImportError:
         dut._log.warning("Could not import python solution, skipping comparison.")
         exp_count = None
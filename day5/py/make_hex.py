@@ -1,6 +1,8 @@
 import sys
 import os
 
+from solution import RangeIndex
+
 def parse_and_write(input_path):
     with open(input_path, 'r') as f:
         content = f.read().strip()
@@ -22,12 +24,23 @@ def parse_and_write(input_path):
             val = int(line)
             f.write(f"{val:016X}\n")
 
+    # Write merged ranges (sorted, disjoint) and the total IDs they cover
+    index = RangeIndex([tuple(map(int, line.split('-'))) for line in range_lines])
+    with open('../input/merged.hex', 'w') as f:
+        for start, end in index.intervals:
+            f.write(f"{start:016X} {end:016X}\n")
+
+    with open('../input/coverage.hex', 'w') as f:
+        f.write(f"{index.covered_count:016X}\n")
+
     print(f"Stats: {len(range_lines)} ranges, {len(id_lines)} ids")
+    print(f"Merged: {len(index.intervals)} ranges covering {index.covered_count} ids")
     
     # Write params header
     with open('../hw/src/params.vh', 'w') as f:
         f.write(f"localparam NUM_RANGES = {len(range_lines)};\n")
         f.write(f"localparam NUM_IDS = {len(id_lines)};\n")
+        f.write(f"localparam NUM_MERGED = {len(index.intervals)};\n")
 
 if __name__ == '__main__':
     # Prefer input.txt, fallback to example.txt
@@ -1,25 +1,160 @@
+import bisect
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # fresh_mask() falls back to one bisect per ID
+    np = None
+
 def parse_input(filename):
     with open(filename, 'r') as f:
         content = f.read().strip()
-    
+
     parts = content.split('\n\n')
     range_lines = parts[0].split('\n')
     id_lines = parts[1].split('\n')
-    
+
     ranges = []
     for line in range_lines:
         start, end = map(int, line.split('-'))
         ranges.append((start, end))
-        
+
     ids = []
     for line in id_lines:
         ids.append(int(line))
-        
+
     return ranges, ids
 
-def solve(filename):
-    ranges, ids = parse_input(filename)
-    
+def merge_ranges(ranges):
+    """Sort and merge overlapping or adjacent (start, end) ranges"""
+    ranges = sorted(ranges)
+    merged_ranges = []
+    if ranges:
+        curr_start, curr_end = ranges[0]
+        for next_start, next_end in ranges[1:]:
+            if next_start <= curr_end + 1: # Overlap or adjacent
+                curr_end = max(curr_end, next_end)
+            else:
+                merged_ranges.append((curr_start, curr_end))
+                curr_start, curr_end = next_start, next_end
+        merged_ranges.append((curr_start, curr_end))
+    return merged_ranges
+
+class RangeIndex:
+    """
+    Merged, sorted range set answering "is this ID fresh?"
+
+    After merging the intervals are disjoint and ordered, so an ID is fresh
+    exactly when the last interval starting at or below it also ends at or
+    above it: one binary search per ID, O((R + Q) log R) overall.
+    """
+
+    def __init__(self, ranges):
+        self.intervals = merge_ranges(ranges)
+        self.starts = [start for start, _ in self.intervals]
+        self.ends = [end for _, end in self.intervals]
+
+    @property
+    def covered_count(self):
+        """
+        Number of distinct IDs covered by any range
+        The merge is a sort-and-sweep over the endpoints, so the union is just
+        the sum of the disjoint interval lengths; no ID is enumerated
+        """
+        return sum(end - start + 1 for start, end in self.intervals)
+
+    def contains(self, id_val):
+        i = bisect.bisect_right(self.starts, id_val) - 1
+        return i >= 0 and id_val <= self.ends[i]
+
+    def fresh_mask(self, ids):
+        """
+        contains() for every ID at once
+        Vectorized with np.searchsorted over 64-bit IDs when NumPy is available
+        """
+        if np is None or not self.intervals:
+            return [self.contains(id_val) for id_val in ids]
+        starts = np.asarray(self.starts, dtype=np.uint64)
+        ends = np.asarray(self.ends, dtype=np.uint64)
+        ids = np.asarray(ids, dtype=np.uint64)
+        idx = np.searchsorted(starts, ids, side='right') - 1
+        return (idx >= 0) & (ids <= ends[np.maximum(idx, 0)])
+
+    def count(self, ids):
+        """Number of fresh IDs"""
+        mask = self.fresh_mask(ids)
+        return sum(mask) if np is None else int(np.count_nonzero(mask))
+
+KEY_BITS = 64
+
+class RangeTree:
+    """
+    Merged ranges laid out as an implicit balanced search tree (Eytzinger order)
+
+    This is the hardware ROM layout: node k (1-based) sits at address k - 1,
+    its children are 2k and 2k + 1, and level L occupies addresses
+    [2^L - 1, 2^(L+1) - 1), so each pipeline stage reads one level.
+    The sorted intervals are padded to 2^depth - 1 nodes by repeating the
+    last one, which keeps the tree ordered and never changes an answer.
+    """
+
+    def __init__(self, ranges):
+        # An empty set still needs one node; (1, 0) never matches
+        intervals = merge_ranges(ranges) or [(1, 0)]
+        self.depth = len(intervals).bit_length()
+        size = (1 << self.depth) - 1
+        padded = intervals + [intervals[-1]] * (size - len(intervals))
+
+        # In-order position of node k in a complete tree of `depth` levels
+        self.nodes = []
+        for k in range(1, size + 1):
+            level = k.bit_length() - 1
+            pos = (2 * (k - (1 << level)) + 1) << (self.depth - 1 - level)
+            self.nodes.append(padded[pos - 1])
+
+    def lookup(self, id_val):
+        """
+        Bit-accurate model of the traversal pipeline
+        Stage L compares the ID with node k's start (unsigned KEY_BITS) and
+        steps to 2k + (id >= start); going right records the node's end as
+        the candidate. After `depth` stages the ID is fresh iff a candidate
+        exists and id <= candidate end.
+        """
+        id_val &= (1 << KEY_BITS) - 1
+        k = 1
+        hit, cand_end = 0, 0
+        for _ in range(self.depth):
+            start, end = self.nodes[k - 1]
+            go_right = int(id_val >= start)
+            if go_right:
+                hit, cand_end = 1, end
+            k = 2 * k + go_right
+        return bool(hit) and id_val <= cand_end
+
+    def fresh_mask(self, ids):
+        """lookup() for every ID at once, one vectorized step per tree level"""
+        if np is None:
+            return [self.lookup(id_val) for id_val in ids]
+        starts = np.asarray([start for start, _ in self.nodes], dtype=np.uint64)
+        ends = np.asarray([end for _, end in self.nodes], dtype=np.uint64)
+        ids = np.asarray(ids, dtype=np.uint64)
+        k = np.ones(len(ids), dtype=np.int64)
+        hit = np.zeros(len(ids), dtype=bool)
+        cand_end = np.zeros(len(ids), dtype=np.uint64)
+        for _ in range(self.depth):
+            go_right = ids >= starts[k - 1]
+            cand_end = np.where(go_right, ends[k - 1], cand_end)
+            hit |= go_right
+            k = 2 * k + go_right
+        return hit & (ids <= cand_end)
+
+    def count(self, ids):
+        """Number of fresh IDs"""
+        mask = self.fresh_mask(ids)
+        return sum(mask) if np is None else int(np.count_nonzero(mask))
+
+def solve_scan(ranges, ids):
+    # Reference: test every ID against every range
     count = 0
     for id_val in ids:
         is_fresh = False
@@ -29,12 +164,33 @@ def solve(filename):
                 break
         if is_fresh:
             count += 1
-            
+
     return count
 
+def solve_coverage(filename):
+    """Total number of IDs covered by the union of all ranges"""
+    ranges, _ = parse_input(filename)
+    return RangeIndex(ranges).covered_count
+
+def solve(filename, mode="index"):
+    """
+    mode="index": merged ranges + binary search per ID (RangeIndex)
+    mode="scan": original every-ID-against-every-range reference
+    """
+    ranges, ids = parse_input(filename)
+    if mode == "scan":
+        return solve_scan(ranges, ids)
+    return RangeIndex(ranges).count(ids)
+
 if __name__ == "__main__":
-    example_result = solve("../input/example.txt")
+    # --scan: use the O(IDs x ranges) reference loop
+    mode = "scan" if '--scan' in sys.argv else "index"
+
+    example_result = solve("../input/example.txt", mode)
     print(f"Example result: {example_result}")
-    
-    real_result = solve("../input/input.txt")
+
+    real_result = solve("../input/input.txt", mode)
     print(f"Real result: {real_result}")
+
+    print(f"Example coverage: {solve_coverage('../input/example.txt')}")
+    print(f"Real coverage: {solve_coverage('../input/input.txt')}")
@@ -1,43 +1,117 @@
 import sys
 import os
 
-def parse_and_write(input_path):
-    with open(input_path, 'r') as f:
-        lines = [line.rstrip('\n') for line in f]
-    
-    if not lines: return
-
-    max_len = max(len(line) for line in lines)
-    H = len(lines)
-    W = max_len
-    
-    # Pad
-    grid = [line.ljust(W) for line in lines]
-    
-    # Add dummy empty column at end to force flush
-    W += 1
-    # Grid logic below access grid[y][x]. 
-    # Must ensure grid has W columns?
-    # Actually just iter range(W-1) and then write 0.
-    
-    # Write Column-Major Input
-    with open('../input/input_cols.hex', 'w') as f:
-        for x in range(W):
-            col_val = 0
-            if x < W - 1:
-                for y in range(H):
-                    char = ord(grid[y][x])
-                    col_val |= (char << (y * 8))
-            else:
-                col_val = 0 # Empty column
-            
-            # Hex chars = H * 2
-            f.write(f"{col_val:0{H*2}X}\n")
+import numpy as np
+
+from solution import SPACE, column_values
+
+# Streaming column transposer: the file is scanned once for line offsets and
+# then read BLOCK_CELLS bytes at a time, so memory stays at one block
+CHUNK_SIZE = 1 << 20
+BLOCK_CELLS = 1 << 20
+WRITE_BUFFER = 1 << 20
+
+# Two uppercase hex digits for every byte value, packed as one uint16
+HEX_DIGITS = np.frombuffer(b''.join(b'%02X' % b for b in range(256)), dtype=np.uint16)
+NEWLINE = ord('\n')
+
+def scan_lines(f, chunk_size=CHUNK_SIZE):
+    """(offset, length) of every line of a binary file, newline excluded"""
+    newlines = []
+    base = 0
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        newlines.extend((np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == NEWLINE) + base).tolist())
+        base += len(chunk)
+
+    starts = [0] + [pos + 1 for pos in newlines]
+    ends = newlines + [base]
+    if starts[-1] == base:
+        # Trailing newline: no empty last line
+        starts.pop()
+        ends.pop()
+
+    lines = []
+    for start, end in zip(starts, ends):
+        # Text-mode readers drop the '\r' of a '\r\n'
+        if end > start:
+            f.seek(end - 1)
+            if f.read(1) == b'\r':
+                end -= 1
+        lines.append((start, end - start))
+    return lines
+
+def read_block(f, lines, x0, x1):
+    """Columns [x0, x1) of every line as an (H, x1 - x0) uint8 block, space padded"""
+    block = np.full((len(lines), x1 - x0), SPACE, dtype=np.uint8)
+    for y, (offset, length) in enumerate(lines):
+        if length > x0:
+            f.seek(offset + x0)
+            data = f.read(min(length, x1) - x0)
+            block[y, :len(data)] = np.frombuffer(data, dtype=np.uint8)
+    return block
+
+def hex_lines(words):
+    """One line of hex per row of a (N, bytes) uint8 array, most significant byte first"""
+    digits = HEX_DIGITS[np.ascontiguousarray(words)].view(np.uint8).reshape(len(words), -1)
+    return np.concatenate([digits, np.full((len(words), 1), NEWLINE, dtype=np.uint8)], axis=1).tobytes()
+
+def value_bits(H):
+    """
+    Width of the col_values.hex value field for columns of H rows
+    At least 64 bits, widened in whole hex digits to hold the largest H-digit
+    value, so the has-digits flag always sits alone in the top digit
+    """
+    return max(64, -(-(10 ** H - 1).bit_length() // 4) * 4)
+
+def col_values_lines(block, bits=64):
+    """col_values.hex lines: bit `bits` = column has digits, [bits-1:0] = value"""
+    has_digits, values = column_values(block)
+    if values.dtype == object:
+        return ''.join(f"{(int(flag) << bits) | val:0{bits // 4 + 1}X}\n"
+                       for flag, val in zip(has_digits.tolist(), values.tolist())).encode()
+    words = values.astype('>u8').view(np.uint8).reshape(-1, 8)
+    flags = np.where(has_digits, ord('1'), ord('0')).astype(np.uint8)[:, None]
+    # int64 values fill the low 16 digits; zero-fill any wider field above them
+    pad = np.full((len(words), bits // 4 - 16), ord('0'), dtype=np.uint8)
+    return np.concatenate([flags, pad, np.frombuffer(hex_lines(words), dtype=np.uint8).reshape(len(words), -1)],
+                          axis=1).tobytes()
+
+def parse_and_write(input_path, input_dir='../input', src_dir='../hw/src', block_cells=BLOCK_CELLS):
+    with open(input_path, 'rb') as f:
+        lines = scan_lines(f)
+
+        if not lines: return
+
+        max_len = max(length for _, length in lines)
+        H = len(lines)
+        W = max_len
+
+        # Add dummy empty column at end to force flush
+        W += 1
+        block_cols = max(1, block_cells // H)
+        bits = value_bits(H)
+
+        # Write Column-Major Input, block by block:
+        # column x is the word with row y in byte y, i.e. rows reversed then transposed
+        with open(os.path.join(input_dir, 'input_cols.hex'), 'wb', buffering=WRITE_BUFFER) as cols_out, \
+             open(os.path.join(input_dir, 'col_values.hex'), 'wb', buffering=WRITE_BUFFER) as values_out:
+            for x0 in range(0, W - 1, block_cols):
+                block = read_block(f, lines, x0, min(x0 + block_cols, W - 1))
+                cols_out.write(hex_lines(block[::-1].T))
+                # Per-column cephalopod values (each column read top to bottom)
+                values_out.write(col_values_lines(block, bits))
+
+            # Empty column
+            cols_out.write(f"{0:0{H*2}X}\n".encode())
+            values_out.write(f"{0:0{bits // 4 + 1}X}\n".encode())
 
     print(f"Stats: W={W}, H={H}")
-    
+
     # Write params header
-    with open('../hw/src/params.vh', 'w') as f:
+    with open(os.path.join(src_dir, 'params.vh'), 'w') as f:
         f.write(f"localparam WIDTH = {W};\n")
         f.write(f"localparam HEIGHT = {H};\n")
         f.write(f"localparam COL_BITS = {H*8};\n")
@@ -48,5 +122,5 @@ if __name__ == '__main__':
     if not os.path.exists(input_path) or os.path.getsize(input_path) == 0:
         input_path = '../input/example.txt'
         print("Using example.txt (input.txt missing or empty)")
-    
+
     parse_and_write(input_path)
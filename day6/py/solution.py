@@ -1,7 +1,154 @@
 
 import sys
 
-def solve(filename):
+try:
+    import numpy as np
+except ImportError:  # solve() falls back to the per-character references
+    np = None
+
+SPACE = ord(' ')
+DIGIT_0 = ord('0')
+OPS = {ord('+'): '+', ord('*'): '*'}
+# Widest digit run an int64 accumulator holds; longer runs use Python ints
+INT64_DIGITS = 18
+
+def load_grid(filename):
+    """Worksheet as a 2-D uint8 array, short rows padded with spaces"""
+    with open(filename, 'rb') as f:
+        # Universal newlines, like reading the file in text mode
+        lines = f.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n').split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    grid = np.full((len(lines), max(len(line) for line in lines)), SPACE, dtype=np.uint8)
+    for y, line in enumerate(lines):
+        grid[y, :len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return grid
+
+def find_regions(grid):
+    """
+    [start, end) column ranges of the problems
+    A region is a run of columns that are not entirely blank
+    """
+    used = ~(grid == SPACE).all(axis=0)
+    edges = np.diff(np.concatenate(([0], used.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def fold_digits(digits, lengths):
+    """
+    Numbers from right-aligned digit columns: digits[:, -1] is the units place
+    Accumulates in int64 and switches to Python ints for very long numbers
+    """
+    dtype = np.int64 if digits.shape[1] <= INT64_DIGITS else object
+    values = np.zeros(len(digits), dtype=dtype)
+    for place in range(digits.shape[1]):
+        values = values * 10 + np.where(place >= digits.shape[1] - lengths, digits[:, place], 0).astype(dtype)
+    return values
+
+def row_numbers(grid):
+    """
+    Every maximal digit run of every row: (row, start_col, value) arrays
+    Blank separator columns end every run, so runs never cross regions
+    """
+    W = grid.shape[1]
+    # A trailing blank column keeps runs from wrapping onto the next row
+    flat = np.pad(grid, ((0, 0), (0, 1)), constant_values=SPACE).ravel()
+    is_digit = (flat >= DIGIT_0) & (flat <= DIGIT_0 + 9)
+    edges = np.diff(np.concatenate(([0], is_digit.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    lengths = ends - starts
+    width = int(lengths.max()) if len(lengths) else 0
+    # Right-align each run into a (runs, width) digit matrix
+    cols = ends[:, None] - width + np.arange(width)
+    digits = flat.take(cols, mode='clip').astype(np.int64) - DIGIT_0
+    values = fold_digits(digits, lengths)
+    return starts // (W + 1), starts % (W + 1), values
+
+def column_values(grid):
+    """
+    Each column read top to bottom as one number (cephalopod notation)
+    Spaces and operators are skipped; returns (has_digits, values) per column
+    """
+    is_digit = (grid >= DIGIT_0) & (grid <= DIGIT_0 + 9)
+    longest = int(is_digit.sum(axis=0).max()) if grid.size else 0
+    dtype = np.int64 if longest <= INT64_DIGITS else object
+    values = np.zeros(grid.shape[1], dtype=dtype)
+    for y in range(grid.shape[0]):
+        digit = (grid[y].astype(np.int64) - DIGIT_0).astype(dtype)
+        values = np.where(is_digit[y], values * 10 + digit, values)
+    return is_digit.any(axis=0), values
+
+def region_ops(grid, region_starts):
+    """Operator of each region; the last one in reading order wins"""
+    ys, xs = np.nonzero(np.isin(grid, list(OPS)))
+    regions = np.searchsorted(region_starts, xs, side='right') - 1
+    # np.nonzero is in reading order, so the first hit from the back is the last
+    found, last = np.unique(regions[::-1], return_index=True)
+    last = len(regions) - 1 - last
+
+    ops = [None] * len(region_starts)
+    for region, char in zip(found.tolist(), grid[ys[last], xs[last]].tolist()):
+        ops[region] = OPS[char]
+    return ops
+
+def evaluate(ops, regions_of, values):
+    """
+    Sum of every region's op applied to the values assigned to it
+    Values are grouped by region and reduced with Python ints (no overflow)
+    """
+    order = np.argsort(regions_of, kind='stable')
+    regions_of = regions_of[order]
+    values = values[order].astype(object)
+    present, first = np.unique(regions_of, return_index=True)
+
+    is_add = np.array([op == '+' for op in ops], dtype=bool)
+    is_mul = np.array([op == '*' for op in ops], dtype=bool)
+    total = 0
+    if len(present):
+        total += np.add.reduceat(values, first)[is_add[present]].sum()
+        total += np.multiply.reduceat(values, first)[is_mul[present]].sum()
+    # A '*' region without numbers is the empty product
+    total += int(is_mul.sum()) - int(is_mul[present].sum())
+    return int(total)
+
+def solve_both(filename):
+    """
+    Both grand totals from one parse and one region/operator pass:
+    (rows: each row of a region is a number,
+     columns: each column, read right to left, is a number)
+    """
+    grid = load_grid(filename)
+    if not grid.size:
+        return 0, 0
+    region_starts, _ = find_regions(grid)
+    ops = region_ops(grid, region_starts)
+
+    _, cols, values = row_numbers(grid)
+    regions_of = np.searchsorted(region_starts, cols, side='right') - 1
+    rows_total = evaluate(ops, regions_of, values)
+
+    has_digits, col_values = column_values(grid)
+    cols = np.flatnonzero(has_digits)[::-1]
+    regions_of = np.searchsorted(region_starts, cols, side='right') - 1
+    columns_total = evaluate(ops, regions_of, col_values[cols])
+    return rows_total, columns_total
+
+def solve(filename, mode="rows"):
+    """
+    mode="rows": grand total reading each row of a region as one number
+    mode="columns": cephalopod math, each column (right to left) is a number
+    """
+    if np is None:
+        return solve_columns_reference(filename) if mode == "columns" else solve_reference(filename)
+    rows_total, columns_total = solve_both(filename)
+    return columns_total if mode == "columns" else rows_total
+
+def solve_reference(filename):
+    # Per-character reference implementation
     with open(filename, 'r') as f:
         lines = [line.rstrip('\n') for line in f]
     
@@ -93,9 +240,57 @@ def solve(filename):
         
     return total
 
+def solve_columns_reference(filename):
+    # Per-character reference for mode="columns"
+    with open(filename, 'r') as f:
+        lines = [line.rstrip('\n') for line in f]
+
+    if not lines:
+        return 0
+
+    W = max(len(line) for line in lines)
+    grid = [line.ljust(W) for line in lines]
+
+    total = 0
+    op = None
+    numbers = []
+    # A trailing blank column closes the last region
+    for x in range(W + 1):
+        column = ''.join(row[x] for row in grid) if x < W else ''
+        if column.strip():
+            # Digits read top to bottom; the last operator in reading order wins
+            digits = ''.join(c for c in column if c.isdigit())
+            if digits:
+                numbers.append(int(digits))
+            for y, c in enumerate(column):
+                if c in '+*' and (op is None or y >= op[0]):
+                    op = (y, c)
+            continue
+        if op is None and not numbers:
+            continue
+
+        if op and op[1] == '+':
+            total += sum(numbers)
+        elif op and op[1] == '*':
+            val = 1
+            for n in numbers:
+                val *= n
+            total += val
+        op = None
+        numbers = []
+
+    return total
+
 if __name__ == "__main__":
     try:
-        real_result = solve("../input/example.txt")
+        # --reference: per-character parsers instead of the byte matrix
+        if '--reference' in sys.argv:
+            real_result = solve_reference("../input/example.txt")
+            cephalopod_result = solve_columns_reference("../input/example.txt")
+        else:
+            real_result = solve("../input/example.txt")
+            cephalopod_result = solve("../input/example.txt", mode='columns')
         print(f"Real Result: {real_result}")
+        print(f"Cephalopod Result: {cephalopod_result}")
     except FileNotFoundError:
         print("Real input not found.")
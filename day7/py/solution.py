@@ -1,78 +1,180 @@
-
 import sys
 
-def solve(filename):
+try:
+    import numpy as np
+except ImportError:  # solve_timelines() falls back to a Python list of counts
+    np = None
+
+# Bitset engine: one Python int per row, bit x set where column x holds the cell
+SPLITTER_TABLE = bytes(ord('1') if b == ord('^') else ord('0') for b in range(256))
+SOURCE_TABLE = bytes(ord('1') if b == ord('S') else ord('0') for b in range(256))
+
+def popcount(value):
+    return value.bit_count() if hasattr(value, 'bit_count') else bin(value).count('1')
+
+def read_grid(filename):
     with open(filename, 'r') as f:
-        grid = [line.strip() for line in f if line.strip()]
-        
+        return [line.strip() for line in f if line.strip()]
+
+def row_bits(row, table):
+    """Bitmask of a row; reversed so column 0 lands in bit 0"""
+    return int(row.encode()[::-1].translate(table) or b'0', 2)
+
+def bits_to_set(bits):
+    """Column indices of the set bits (for the debug log)"""
+    columns = set()
+    while bits:
+        low = bits & -bits
+        columns.add(low.bit_length() - 1)
+        bits ^= low
+    return columns
+
+def print_row(y, active, splitters_hit):
+    print(f"Row {y}: Active {bits_to_set(active)}, Splitters {splitters_hit}")
+
+def solve(filename, debug=None):
+    """
+    Beam propagation on bitsets: (splitters hit, beams leaving the bottom)
+    Per row, O(W / 64) word operations:
+        hits   = active & splitters
+        active = (active & ~splitters) | (hits << 1) | (hits >> 1)
+    debug, if given, is called as debug(row, active_bits, splitters_hit)
+    """
+    grid = read_grid(filename)
+
     H = len(grid)
     if H == 0: return 0
     W = max(len(line) for line in grid)
-    
-    # Active set of x-coordinates
-    active = set()
-    
-    # Find S
-    for x in range(W):
-        if 'S' in grid[0]: # Assumption: S is on first row? Text says "Marked S".
-            # The example has S on first row. The input might have S elsewhere?
-            # "A tachyon beam enters the manifold at the location marked S"
-            # If S is at y=0, we start there.
-            # If S is lower, we start simulation when we hit row y(S)?
-             pass
-
-    # Better logic:
-    # Iterate rows.
-    # Current active set.
-    # If we find S in current row, add its x to active.
-    
+    mask = (1 << W) - 1
+
+    active = 0
+    splitters_hit = 0
+
+    for y, row in enumerate(grid):
+        # Add new sources
+        active |= row_bits(row, SOURCE_TABLE)
+
+        splitters = row_bits(row, SPLITTER_TABLE)
+        hits = active & splitters
+        splitters_hit += popcount(hits)
+        # Split beams continue from the immediate left and right
+        active = (active & ~splitters) | ((hits << 1) & mask) | (hits >> 1)
+
+        if debug:
+            debug(y, active, splitters_hit)
+
+    return splitters_hit, popcount(active)
+
+# A column gains at most 3x its largest neighbour per row (straight on plus
+# both splits), so counts up to this bound cannot overflow int64 in one row
+INT64_SAFE = (2 ** 63 - 1) // 3
+
+def solve_timelines(filename):
+    """
+    Number of distinct timelines leaving the bottom
+    counts[x] is how many timelines reach column x; a splitter sends its
+    count both ways, so per row (vectorized shifted adds):
+        next = counts off splitters; next[x - 1] += hits[x]; next[x + 1] += hits[x]
+    Counts are int64 until they could overflow, then Python ints
+    """
+    grid = read_grid(filename)
+
+    H = len(grid)
+    if H == 0: return 0
+    W = max(len(line) for line in grid)
+
+    if np is None:
+        return solve_timelines_list(grid, W)
+
+    cells = np.frombuffer(''.join(line.ljust(W, '.') for line in grid).encode(), dtype=np.uint8).reshape(H, W)
+    counts = np.zeros(W, dtype=np.int64)
+
+    for y in range(H):
+        # Each source starts one timeline
+        counts = counts + (cells[y] == ord('S'))
+        if counts.dtype != object and counts.max() > INT64_SAFE:
+            counts = counts.astype(object)
+
+        splitters = cells[y] == ord('^')
+        hits = np.where(splitters, counts, 0)
+        counts = np.where(splitters, 0, counts)
+        counts[:-1] += hits[1:]
+        counts[1:] += hits[:-1]
+
+    # Total in Python ints: the column counts may each be near the int64 bound
+    return int(counts.astype(object).sum())
+
+def solve_timelines_list(grid, W):
+    # Pure-Python solve_timelines(), Python ints throughout
+    counts = [0] * W
+    for row in grid:
+        for x, cell in enumerate(row):
+            if cell == 'S':
+                counts[x] += 1
+
+        next_counts = [0] * W
+        for x, n in enumerate(counts):
+            if not n:
+                continue
+            if x < len(row) and row[x] == '^':
+                if x > 0: next_counts[x - 1] += n
+                if x < W - 1: next_counts[x + 1] += n
+            else:
+                next_counts[x] += n
+        counts = next_counts
+
+    return sum(counts)
+
+def solve_reference(filename, debug=None):
+    # Set-based reference implementation
+    grid = read_grid(filename)
+
+    H = len(grid)
+    if H == 0: return 0
+    W = max(len(line) for line in grid)
+
     active_now = set()
     splitters_hit = 0
-    
+
     for y in range(H):
         row = grid[y]
         next_active = set()
-        
+
         # Add new sources
         for x in range(W):
             if row[x] == 'S':
                  active_now.add(x)
-                 
+
         # Process active beams
         # Use simple iteration over sorted list to be deterministic
         current_beams = sorted(list(active_now))
-        
+
         for x in current_beams:
             # Beam is entering (x, y).
             cell = row[x]
-            
+
             if cell == '^':
                 splitters_hit += 1
                 # Splits: spawns at (x-1, y+1) and (x+1, y+1)
-                # But wait, does it spawn in CURRENT row or NEXT row logic?
-                # "continuing from the immediate left... of the splitter"
-                # If we are at row y, splitting happens. Result beams are at y+1?
                 if x > 0: next_active.add(x - 1)
                 if x < W - 1: next_active.add(x + 1)
             else:
-                # '.' or 'S' (passes through S?)
-                # "Tachyon beams pass freely through empty space (.)"
-                # Assume S acts as empty after emission?
-                # Beam continues down to (x, y+1)
+                # '.' or 'S': beam continues down to (x, y+1)
                 next_active.add(x)
-                
+
         active_now = next_active
-        print(f"Row {y}: Active {active_now}, Splitters {splitters_hit}")
-        
-        # Visualize
-        # line = ""
-        # for x in range(W):
-        #     if x in active_now: line += "|"
-        #     else: line += "."
-        # print(line)
-        
+        if debug:
+            print(f"Row {y}: Active {active_now}, Splitters {splitters_hit}")
+
     return splitters_hit, len(active_now)
 
 if __name__ == "__main__":
-    splitters, beams = solve("../input/example.txt")
+    # --debug: print the active beams after every row
+    debug = '--debug' in sys.argv
+    # --reference: set-based engine instead of the bitsets
+    if '--reference' in sys.argv:
+        splitters, beams = solve_reference("../input/example.txt", debug)
+    else:
+        splitters, beams = solve("../input/example.txt", print_row if debug else None)
     print(f"Example: Splitters Hit: {splitters}, Final Beams: {beams}")
+    print(f"Example: Timelines: {solve_timelines('../input/example.txt')}")
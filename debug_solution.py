@@ -1,74 +1,13 @@
 import sys
 import os
 
-def solve(input_str):
-    grid = [list(line.strip()) for line in input_str.strip().split('\n')]
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    
-    count = 0
-    
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] != '@':
-                continue
-                
-            neighbor_count = 0
-            # Check 8 neighbors
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    
-                    nr, nc = r + dr, c + dc
-                    
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
-            
-            if neighbor_count < 4:
-                count += 1
-                print(f"Py: Found at Row {r} Col {c} (Neighbors {neighbor_count})")
-                
-    return count
+# Debug entry point for the Day 4 solver; the engines live in day4/py/solution.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'day4', 'py'))
+from solution import solve as _solve, solve_part2, print_hit
 
-def solve_part2(input_str):
-    grid = [list(line.strip()) for line in input_str.strip().split('\n')]
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    
-    total_removed = 0
-    
-    while True:
-        to_remove = []
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != '@':
-                    continue
-                
-                neighbor_count = 0
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        if dr == 0 and dc == 0:
-                            continue
-                        
-                        nr, nc = r + dr, c + dc
-                        
-                        if 0 <= nr < rows and 0 <= nc < cols:
-                            if grid[nr][nc] == '@':
-                                neighbor_count += 1
-                
-                if neighbor_count < 4:
-                    to_remove.append((r, c))
-        
-        if not to_remove:
-            break
-            
-        total_removed += len(to_remove)
-        for r, c in to_remove:
-            grid[r][c] = '.'
-            
-    return total_removed
+def solve(input_str):
+    """Part 1, printing every accessible roll as it is found"""
+    return _solve(input_str, print_hit)
 
 if __name__ == '__main__':
     input_path = '../input/input.txt'